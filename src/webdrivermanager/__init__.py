@@ -6,6 +6,7 @@ from .gecko import GeckoDriverManager
 from .edge import EdgeDriverManager
 from .ie import IEDriverManager
 from .edgechromium import EdgeChromiumDriverManager
+from .transport import create_session, get_session
 
 from ._version import get_versions
 
@@ -27,6 +28,8 @@ __all__ = [
     "IEDriverManager",
     "EdgeChromiumDriverManager",
     "get_version",
+    "create_session",
+    "get_session",
     "AVAILABLE_DRIVERS",
 ]
 
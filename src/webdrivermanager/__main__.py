@@ -3,10 +3,12 @@
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from requests import ConnectionError
 
 from ._version import get_versions
 from webdrivermanager import AVAILABLE_DRIVERS as DOWNLOADERS
+from .cache import DEFAULT_CACHE_TTL
 from .misc import LOGGER, LOG_LEVELS
 
 
@@ -61,44 +63,137 @@ def parse_command_line():
         default=None,
         help=f"Overrides bitness detection with given value. Values: {' '.join(BITNESS)}",
     )
+    parser.add_argument(
+        "--cache-ttl",
+        action="store",
+        dest="cache_ttl",
+        metavar="SECONDS",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help=f"How long resolved latest/compatible versions are cached. 0 disables the cache. Default: {DEFAULT_CACHE_TTL}",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        dest="refresh",
+        default=False,
+        help="Ignore cached latest/compatible versions and resolve them again",
+    )
+    parser.add_argument(
+        "--stale-while-revalidate",
+        action="store",
+        dest="stale_while_revalidate",
+        metavar="SECONDS",
+        type=int,
+        default=0,
+        help="How long after --cache-ttl an expired latest version is still used while it is resolved again in the background. Default: 0",
+    )
+    parser.add_argument(
+        "--resolve-only",
+        action="store_true",
+        dest="resolve_only",
+        default=False,
+        help="Only resolve and cache the requested versions, without downloading or linking anything",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        action="store",
+        dest="jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Number of drivers to resolve and download concurrently. Default: 1",
+    )
     parser.add_argument("--version", action="version", version=f"%(prog)s {get_versions()['version']}")
     parser.add_argument("--loglevel", default="info", dest="loglevel", choices=list(LOG_LEVELS.keys())[1:], help="Log Level")
     return parser.parse_args()
 
 
+def install_driver(args, browser, output=print, show_progress_bar=True):
+    if ":" in browser:
+        browser, version = browser.split(":")
+    else:
+        version = "compatible"
+
+    if browser.lower() not in DOWNLOADERS.keys():
+        output(f'Unrecognized browser: "{browser}".  Ignoring...')
+        return
+
+    if not args.resolve_only:
+        output(f'Downloading WebDriver for browser: "{browser}"')
+    downloader = DOWNLOADERS[browser.lower()](
+        args.downloadpath,
+        args.linkpath,
+        args.os_name,
+        args.bitness,
+        cache_ttl=args.cache_ttl,
+        refresh=args.refresh,
+        stale_while_revalidate=args.stale_while_revalidate,
+        # The command exits right after installing, so stale versions are refreshed by a process that outlives it
+        detached_refresh=True,
+    )
+
+    if args.resolve_only:
+        output(f'Resolved version: "{downloader.resolve_version(version)}"')
+        return
+
+    extracted_binary, link = downloader.download_and_install(version, show_progress_bar=show_progress_bar)
+
+    output(f'Driver binary downloaded to: "{extracted_binary}"')
+    if link:
+        if link.is_symlink():
+            output(f"Symlink created: {link}")
+        else:
+            output(f"Driver copied to: {link}")
+        link_path = link.parent
+        if str(link_path) not in os.environ["PATH"].split(os.pathsep):
+            output(f'WARNING: Path "{link_path}" is not in the PATH environment variable.')
+    else:
+        output("Linking webdriver skipped")
+
+
+def install_drivers_in_parallel(args):
+    """Installs all requested drivers in a thread pool, printing the output of each driver once it is done."""
+
+    def job(browser):
+        lines = []
+        try:
+            install_driver(args, browser, output=lines.append, show_progress_bar=False)
+        except ConnectionError:
+            lines.append("Unable to download webdriver's at this time due to network connectivity error")
+            return (lines, False)
+        except Exception as exc:
+            lines.append(f'Failed to install WebDriver for "{browser}": {exc}')
+            return (lines, False)
+        # Unrecognized browsers are ignored like in sequential mode, they do not fail the run
+        return (lines, True)
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        for future in as_completed([executor.submit(job, browser) for browser in args.browser]):
+            lines, succeeded = future.result()
+            failed = failed or not succeeded
+            print("\n".join(lines))
+            print("")
+
+    if failed:
+        sys.exit(1)
+
+
 def main():
     args = parse_command_line()
     LOGGER.setLevel(LOG_LEVELS[args.loglevel])
-    for browser in args.browser:
+    if args.jobs > 1:
+        install_drivers_in_parallel(args)
+        return
 
-        if ":" in browser:
-            browser, version = browser.split(":")
-        else:
-            version = "compatible"
-
-        if browser.lower() in DOWNLOADERS.keys():
-            print(f'Downloading WebDriver for browser: "{browser}"')
-            downloader = DOWNLOADERS[browser](args.downloadpath, args.linkpath, args.os_name, args.bitness)
-
-            try:
-                extracted_binary, link = downloader.download_and_install(version)
-            except ConnectionError:
-                print("Unable to download webdriver's at this time due to network connectivity error")
-                sys.exit(1)
-
-            print(f'Driver binary downloaded to: "{extracted_binary}"')
-            if link:
-                if link.is_symlink():
-                    print(f"Symlink created: {link}")
-                else:
-                    print(f"Driver copied to: {link}")
-                link_path = link.parent
-                if str(link_path) not in os.environ["PATH"].split(os.pathsep):
-                    print(f'WARNING: Path "{link_path}" is not in the PATH environment variable.')
-            else:
-                print("Linking webdriver skipped")
-        else:
-            print('Unrecognized browser: "{browser}".  Ignoring...')
+    for browser in args.browser:
+        try:
+            install_driver(args, browser)
+        except ConnectionError:
+            print("Unable to download webdriver's at this time due to network connectivity error")
+            sys.exit(1)
         print("")
 
 
@@ -5,26 +5,46 @@ import abc
 import sys
 import stat
 import shutil
+import subprocess
 import tarfile
 import gzip
+import hashlib
 import zipfile
 import platform
+import tempfile
+import threading
+import time
+import uuid
 import tqdm
-import requests
 import os
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 from appdirs import AppDirs
 
-from .misc import LOGGER, _inside_virtualenv, raise_runtime_error
+from .cache import DEFAULT_CACHE_TTL, HttpMetadataCache, JsonCache
+from .lock import FileLock
+from .misc import LOGGER, _inside_virtualenv, get_umask, raise_runtime_error
+from .transport import get_session, release_response
 
 
 class WebDriverManagerBase:
     """Abstract Base Class for the different web driver downloaders"""
 
     __metaclass__ = abc.ABCMeta
+    driver_name: Optional[str] = None
     fallback_url = None
     driver_filenames = None
+    # Seconds to wait for another process installing the same driver, None waits forever
+    lock_timeout = 600
+    # (version cache path, key) -> time a background refresh of the cached version started, shared by all managers
+    # of the process. Detached refreshes are not tracked once started, so their entries are kept until they expire.
+    _version_refreshes: Dict[Tuple[str, str], float] = {}
+    _version_refreshes_lock = threading.Lock()
+    # Seconds a detached refresh of a stale version is given before stale lookups start another one
+    version_refresh_timeout = 60
+    # Seconds GitHub API is skipped after a rate limited response that does not tell when the limit resets
+    github_rate_limit_backoff = 60
 
     def _get_basepath(self):
         if self.os_name in ["mac", "linux"] and os.geteuid() == 0:
@@ -33,7 +53,19 @@ class WebDriverManagerBase:
             return Path(sys.prefix) / "WebDriverManager"
         return Path(self.dirs.user_data_dir)
 
-    def __init__(self, download_root=None, link_path=None, os_name=None, bitness=None):
+    def __init__(
+        self,
+        download_root=None,
+        link_path=None,
+        os_name=None,
+        bitness=None,
+        cache_ttl=DEFAULT_CACHE_TTL,
+        refresh=False,
+        session=None,
+        verify_checksums=True,
+        stale_while_revalidate=0,
+        detached_refresh=False,
+    ):
         """
         Initializer for the class.  Accepts two optional parameters.
 
@@ -44,6 +76,17 @@ class WebDriverManagerBase:
                           or Linux, the default will be 'usr/local/bin', otherwise appdirs python module will be used
                           to determine appropriate location if no value give. If set "AUTO", link will be created into
                           first writeable directory in PATH. If set "SKIP", no link will be created.
+        :param cache_ttl: Seconds a resolved "latest" or "compatible" version is reused from the cache stored under
+                          download_root. 0 disables the cache.
+        :param refresh: If True, cached versions are ignored and replaced with freshly resolved ones.
+        :param session: requests.Session used for all HTTP requests. If not given, a process wide session with
+                        connection pooling from webdrivermanager.transport.get_session() is used.
+        :param verify_checksums: If True, archives are hashed while downloading, checked against checksums published by
+                                 the download site when available, and cached archives are verified before reuse.
+        :param stale_while_revalidate: Seconds after cache_ttl during which an expired "latest" version is still returned
+                                       right away while it is resolved again in the background. 0 disables this.
+        :param detached_refresh: If True, stale versions are resolved again by a detached ``python -m webdrivermanager``
+                                 process instead of a thread, so short lived processes do not wait for the refresh.
         """
 
         if not bitness:
@@ -81,6 +124,25 @@ class WebDriverManagerBase:
         except OSError:
             pass
 
+        self.session = session or get_session()
+        self.verify_checksums = verify_checksums
+        # Download URL -> {"md5": hexdigest, ...} as published by the download site, filled in by get_download_url
+        self._expected_checksums = {}
+        self.refresh = refresh
+        self.stale_while_revalidate = stale_while_revalidate
+        self.detached_refresh = detached_refresh
+        self.version_cache = JsonCache(self.download_root / "cache" / "versions.json", ttl=cache_ttl)
+        # Release and download indexes built from upstream listings, shared by processes within cache_ttl.
+        self.index_cache = JsonCache(self.download_root / "cache" / "indexes.json", ttl=cache_ttl)
+        # Metadata documents with their ETag/Last-Modified validators, revalidated with conditional requests.
+        self.http_cache = HttpMetadataCache(self.download_root / "cache" / "http")
+        # Host -> time until which its API is rate limiting us, shared by processes so they skip doomed requests.
+        self.rate_limits = JsonCache(self.download_root / "cache" / "ratelimits.json", ttl=None)
+        # Archives already downloaded for (driver, version, os, bitness), lets pinned versions install without network.
+        self.archive_manifest = JsonCache(self.download_root / "cache" / "archives.json", ttl=None)
+        # Archive digest -> driver binary extracted from it, lets valid installs skip extraction.
+        self.extraction_manifest = JsonCache(self.download_root / "cache" / "extracted.json", ttl=None)
+
         if self.link_path:
             try:
                 self.link_path.mkdir(parents=True, exist_ok=True)
@@ -143,13 +205,143 @@ class WebDriverManagerBase:
         # Identify mac CPU type, refer to https://stackoverflow.com/questions/65970469/what-does-platform-system-and-platform-architecture-return-on-apple-m1-silic
         return "m1" if platform.processor() == "arm" else "intel" if self.os_name == "mac" else ""
 
+    def _get_indexed_download(self, index, version, os_name, arch):
+        """
+        Looks up a download from a DriverIndex, remembering its published checksum for verifying the download.
+
+        :returns: Tuple of download URL and filename.
+        """
+        record = index.get(version, os_name, arch)
+        if not record:
+            raise_runtime_error(f"Error, unable to find appropriate download for {self.os_name}{self.bitness}.")
+        if record.md5:
+            self._expected_checksums[record.url] = {"md5": record.md5}
+        return (record.url, record.filename)
+
+    def _version_cache_key(self, method):
+        key = f"{self.driver_name or type(self).__name__}:{method}:{self.os_name}:{self.bitness}"
+        get_browser_version = getattr(self, "_get_browser_version", None)
+        if method == "compatible" and get_browser_version:
+            # Compatible version depends on the installed browser, new browser means new cache entry.
+            key = f"{key}:{get_browser_version()}"
+        return key
+
+    def _get_cached_version(self, method, resolver):
+        key = self._version_cache_key(method)
+        if not self.refresh:
+            version = self.version_cache.get(key)
+            if version:
+                LOGGER.debug("Using cached %s version: %s", method, version)
+                return version
+
+            if method == "latest" and self.stale_while_revalidate:
+                version = self._get_stale_version(key)
+                if version:
+                    return version
+
+        version = resolver()
+        if version:
+            self.version_cache.set(key, version)
+        return version
+
+    def _get_stale_version(self, key):
+        cached = self.version_cache.get_entry(key)
+        ttl = self.version_cache.ttl
+        if not cached or not cached[0] or not ttl or cached[1] > ttl + self.stale_while_revalidate:
+            return None
+
+        version, age = cached
+        LOGGER.debug("Using %d seconds old cached version %s while resolving it again", age, version)
+        refresh = (str(self.version_cache.path), key)
+        with self._version_refreshes_lock:
+            started = self._version_refreshes.get(refresh)
+            if started is not None and time.time() - started < self.version_refresh_timeout:
+                return version
+            self._version_refreshes[refresh] = time.time()
+
+        if self.detached_refresh:
+            self._spawn_version_refresh(key)
+        else:
+            threading.Thread(target=self._refresh_cached_version, args=(key,), name=f"refresh-{key}", daemon=True).start()
+        return version
+
+    def _refresh_cached_version(self, key):
+        # Resolved with a manager of its own, so the refresh does not race with lookups on this one
+        manager = type(self)(
+            download_root=self.download_root,
+            link_path="SKIP",
+            os_name=self.os_name,
+            bitness=self.bitness,
+            cache_ttl=self.version_cache.ttl,
+            refresh=True,
+            session=self.session,
+            verify_checksums=self.verify_checksums,
+        )
+        # Download site URLs overridden on this instance, for example to use a mirror, apply to the refresh too
+        for name, value in vars(self).items():
+            if name.endswith("_url") and hasattr(type(self), name):
+                setattr(manager, name, value)
+        try:
+            version = manager.get_latest_version()
+            if version:
+                self.version_cache.set(key, version)
+                LOGGER.debug("Refreshed cached version %s: %s", key, version)
+        except Exception as exc:
+            LOGGER.debug("Unable to refresh cached version %s: %s", key, exc)
+        finally:
+            with self._version_refreshes_lock:
+                self._version_refreshes.pop((str(self.version_cache.path), key), None)
+
+    def _spawn_version_refresh(self, key):
+        """Resolves the latest version again in a detached process, which outlives the current one."""
+        cmd = [
+            sys.executable,
+            "-m",
+            "webdrivermanager",
+            f"{self.driver_name}:latest",
+            "--resolve-only",
+            "--refresh",
+            "--downloadpath",
+            str(self.download_root),
+            "--linkpath",
+            "SKIP",
+            "--os",
+            self.os_name,
+            "--bitness",
+            self.bitness,
+            "--cache-ttl",
+            str(self.version_cache.ttl),
+        ]
+        if os.name == "nt":
+            detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            detach = {"start_new_session": True}
+        try:
+            subprocess.Popen(  # noqa: S603
+                cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=True, **detach
+            )
+            LOGGER.debug("Started detached refresh of cached version %s", key)
+        except OSError as exc:
+            LOGGER.debug("Unable to start refresh of cached version %s: %s", key, exc)
+            with self._version_refreshes_lock:
+                self._version_refreshes.pop((str(self.version_cache.path), key), None)
+
+    def resolve_version(self, version="latest"):
+        """
+        Method for resolving "latest" or "compatible" into the version they currently mean, using the version cache.
+
+        :param version: "latest", "compatible" or a version string, which is returned as is.
+        :returns: The resolved version string.
+        """
+        return self._parse_version(version)
+
     def _parse_version(self, version):
         method = version.strip().lower()
 
         # Attempt to match webdriver to current browser version, if supported
         if method == "compatible":
             try:
-                return self.get_compatible_version()
+                return self._get_cached_version(method, self.get_compatible_version)
             except NotImplementedError:
                 pass
             except Exception as exc:
@@ -157,51 +349,51 @@ class WebDriverManagerBase:
             method = "latest"
 
         if method == "latest":
-            return self.get_latest_version()
+            return self._get_cached_version(method, self.get_latest_version)
         else:
             return version
 
-    def _get_latest_version_with_github_page_fallback(self, url, fallback_url, required_version):
-        version = None
-        info = requests.get(f"{url}{required_version}")
-
-        if info.ok:
-            version = info.json()["tag_name"]
-        elif info.status_code == 403:
-            response = requests.get(fallback_url)
-            tree = BeautifulSoup(response.text, "html.parser")
-            latest_release = tree.find("div", {"class", "release-header"}).findAll("a")[0]
-            version = latest_release.text
-        else:
-            raise_runtime_error(f"Error attempting to get version info, got status code: {info.status_code}")
-
-        return version  # noqa: R504
-
-    def _parse_github_api_response(self, version, response):
-        filenames = [asset["name"] for asset in response.json()["assets"]]
-        filename = [name for name in filenames if self.os_name in name]
-        mac_cpu_type = self.get_mac_cpu_type()
-
-        if not filename:
-            raise_runtime_error(f"Error, unable to find a download for os: {self.os_name}")
+    def _github_api_get(self, url, **kwargs):
+        """
+        GET request to GitHub API, authenticated with the GITHUB_TOKEN environment variable when it is set.
 
-        if len(filename) > 1:
-            if self.os_name == "mac":
-                filename = (
-                    [name for name in filenames if "aarch64" in name]
-                    if mac_cpu_type == "arm"
-                    else [name for name in filenames if "aarch64" not in name]
-                )
-            else:
-                filename = [name for name in filenames if self.os_name + self.bitness in name and not name.endswith(".asc")]
-                if len(filename) != 1:
-                    raise_runtime_error(f"Error, unable to determine correct filename for {self.bitness}bit {self.os_name}")
+        Rate limit headers of the response are read, and once the limit is used up, requests are skipped until it resets.
 
-        filename = filename[0]
+        :returns: The response, or None when GitHub API is rate limiting. Callers should then use cached data or the
+                  GitHub release pages instead.
+        """
+        limited_until = self.rate_limits.get("api.github.com")
+        if limited_until and limited_until > time.time():
+            LOGGER.debug("GitHub API is rate limited until %s, skipping %s", time.ctime(limited_until), url)
+            return None
 
-        url = response.json()["assets"][filenames.index(filename)]["browser_download_url"]
-        LOGGER.info("Download URL: %s", url)
-        return url
+        headers = dict(kwargs.pop("headers", None) or {})
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        response = self.session.get(url, headers=headers, **kwargs)
+
+        # Primary limits use up X-RateLimit-Remaining, secondary limits tell when to retry. Other 403 responses, such
+        # as missing permissions, are not rate limits and are returned to the caller.
+        if response.headers.get("X-RateLimit-Remaining") != "0" and "Retry-After" not in response.headers:
+            return response
+        limited_until = self._get_rate_limit_reset(response)
+        LOGGER.info("GitHub API rate limit reached, using cached data and release pages until %s", time.ctime(limited_until))
+        self.rate_limits.set("api.github.com", limited_until)
+        return None if response.status_code in (403, 429) else response
+
+    def _get_rate_limit_reset(self, response):
+        for header, offset in (("Retry-After", time.time()), ("X-RateLimit-Reset", 0)):
+            value = response.headers.get(header)
+            if value and value.isdigit():
+                return int(value) + offset
+        return time.time() + self.github_rate_limit_backoff
+
+    def _get_latest_version_from_github_page(self, fallback_url):
+        response = self.session.get(fallback_url)
+        tree = BeautifulSoup(response.text, "html.parser")
+        latest_release = tree.find("div", {"class", "release-header"}).findAll("a")[0]
+        return latest_release.text
 
     def _parse_github_page(self, version):
         if version == "latest":
@@ -211,7 +403,7 @@ class WebDriverManagerBase:
             release_url = f"{self.fallback_url}tag/{version}"
             matcher = r".*\/releases\/download\/{}\/.*{}".format(version, self.os_name)
 
-        response = requests.get(release_url)
+        response = self.session.get(release_url)
         if response.status_code != 200:
             return None
 
@@ -226,6 +418,67 @@ class WebDriverManagerBase:
 
         return None
 
+    def _archive_key(self, version):
+        return f"{self.driver_name or type(self).__name__}:{version}:{self.os_name}:{self.bitness}"
+
+    def _get_installed_archive(self, version, dl_path):
+        entry = self.archive_manifest.get(self._archive_key(version))
+        if not entry:
+            return None
+
+        filename_with_path = dl_path / entry["filename"]
+        if not filename_with_path.is_file():
+            return None
+
+        if self.verify_checksums and not self._archive_is_valid(filename_with_path, entry):
+            LOGGER.warning("Cached archive %s does not match its recorded checksum - redownloading", filename_with_path)
+            filename_with_path.unlink()
+            return None
+        return filename_with_path
+
+    def _add_installed_archive(self, version, download_url, filename, digests=None):
+        entry = {"url": download_url, "filename": filename}
+        if digests:
+            entry.update(digests)
+        self.archive_manifest.set(self._archive_key(version), entry)
+
+    @staticmethod
+    def _new_hashers():
+        return {"sha256": hashlib.sha256(), "md5": hashlib.md5()}  # nosec - md5 only used for comparing to server values
+
+    @staticmethod
+    def _update_hashers(hashers, path):
+        with open(path, mode="rb") as fileobj:
+            for chunk in iter(lambda: fileobj.read(65536), b""):
+                for hasher in hashers.values():
+                    hasher.update(chunk)
+
+    def _file_digests(self, path):
+        hashers = self._new_hashers()
+        self._update_hashers(hashers, path)
+        return self._digests(hashers, path.stat().st_size)
+
+    @staticmethod
+    def _digests(hashers, size):
+        digests = {name: hasher.hexdigest() for name, hasher in hashers.items()}
+        digests["size"] = size
+        return digests
+
+    def _archive_is_valid(self, path, entry):
+        if "size" in entry and path.stat().st_size != entry["size"]:
+            return False
+        if "sha256" not in entry:
+            return True
+        return self._file_digests(path)["sha256"] == entry["sha256"]
+
+    def _check_expected_checksums(self, download_url, digests):
+        """Compares digests of a downloaded archive with the ones published by the download site, if any."""
+        expected = self._expected_checksums.get(download_url, {})
+        for name, value in expected.items():
+            if name in digests and digests[name] != value.lower():
+                return False
+        return True
+
     def download(self, version="latest", show_progress_bar=True, force=False):
         """
         Method for downloading a web driver binary.
@@ -238,36 +491,118 @@ class WebDriverManagerBase:
         :param show_progress_bar: Boolean (default=install_requires) indicating if a progress bar should be shown in the console.
         :returns: The path + filename to the downloaded web driver binary.
         """
-        (download_url, filename) = self.get_download_url(version)
+        # Resolve "latest"/"compatible" only once, the get_* methods will receive the concrete version.
+        version = self._parse_version(version)
+        with self._install_lock(version):
+            return self._download(version, show_progress_bar=show_progress_bar, force=force)
+
+    def _install_lock(self, version):
+        lock_name = re.sub(r"[^\w.-]", "_", self._archive_key(version))
+        return FileLock(self.download_root / "cache" / "locks" / f"{lock_name}.lock", timeout=self.lock_timeout)
 
+    def _download(self, version, show_progress_bar=True, force=False):
         dl_path = Path(self.get_download_path(version))
+
+        if not force:
+            filename_with_path = self._get_installed_archive(version, dl_path)
+            if filename_with_path:
+                LOGGER.info("Skipping download. File %s already on filesystem.", filename_with_path)
+                return filename_with_path
+
+        download_url, filename = self.get_download_url(version)
+
         filename_with_path = dl_path / filename
+        part_file = dl_path / f"{filename}.part"
         dl_path.mkdir(parents=True, exist_ok=True)
         if filename_with_path.exists():
             if force:
                 filename_with_path.unlink()
             else:
-                LOGGER.info("Skipping download. File %s already on filesystem.", filename_with_path)
-                return filename_with_path
-
-        data = requests.get(download_url, stream=True)
-        if data.status_code == 200:
-            LOGGER.debug("Starting download of %s to %s", download_url, filename_with_path)
-            with open(filename_with_path, mode="wb") as fileobj:
-                chunk_size = 1024
-                if show_progress_bar:
-                    expected_size = int(data.headers["Content-Length"])
-                    for chunk in tqdm.tqdm(data.iter_content(chunk_size), total=int(expected_size / chunk_size), unit="kb"):
-                        fileobj.write(chunk)
+                digests = self._file_digests(filename_with_path) if self.verify_checksums else None
+                if digests and not self._check_expected_checksums(download_url, digests):
+                    LOGGER.warning("Archive %s does not match the published checksum - redownloading", filename_with_path)
+                    filename_with_path.unlink()
                 else:
-                    for chunk in data.iter_content(chunk_size):
-                        fileobj.write(chunk)
+                    LOGGER.info("Skipping download. File %s already on filesystem.", filename_with_path)
+                    self._add_installed_archive(version, download_url, filename, digests)
+                    return filename_with_path
+
+        if force and part_file.exists():
+            part_file.unlink()
+
+        # Archives are streamed into a .part file first, and an interrupted download continues from where it stopped.
+        headers = {"Accept-Encoding": "identity"}
+        resume_from = part_file.stat().st_size if part_file.exists() else 0
+        if resume_from:
+            headers["Range"] = f"bytes={resume_from}-"
+
+        data = self.session.get(download_url, stream=True, headers=headers)
+        if data.status_code == 416 or (data.status_code == 206 and self._get_range_start(data) != resume_from):
+            LOGGER.debug("Server did not resume %s from byte %d, starting over", part_file, resume_from)
+            release_response(data)
+            part_file.unlink()
+            resume_from = 0
+            data = self.session.get(download_url, stream=True, headers={"Accept-Encoding": "identity"})
+
+        if data.status_code in [200, 206]:
+            # Checksums are calculated while streaming, so the archive never needs to be read back for verification.
+            hashers = self._new_hashers() if self.verify_checksums else {}
+            if data.status_code == 200:
+                resume_from = 0
+            elif self._get_range_start(data) != resume_from:
+                release_response(data)
+                raise_runtime_error(
+                    f"Error downloading file {filename}, got unexpected range: {data.headers.get('Content-Range')}"
+                )
+            else:
+                LOGGER.debug("Resuming download of %s from byte %d", download_url, resume_from)
+                if hashers:
+                    self._update_hashers(hashers, part_file)
+            LOGGER.debug("Starting download of %s to %s", download_url, filename_with_path)
+            with open(part_file, mode="ab" if resume_from else "wb") as fileobj:
+                written = self._write_response(data, fileobj, show_progress_bar, hashers)
+
+            expected_size = data.headers.get("Content-Length")
+            if expected_size is not None and written != int(expected_size):
+                raise_runtime_error(
+                    f"Error downloading file {filename}, got {written} bytes out of {expected_size}. Run again to resume.",
+                )
+
+            digests = self._digests(hashers, resume_from + written) if hashers else None
+            if digests and not self._check_expected_checksums(download_url, digests):
+                part_file.unlink()
+                raise_runtime_error(f"Error downloading file {filename}, checksum does not match the published one.")
+
+            os.replace(part_file, filename_with_path)
             LOGGER.debug("Finished downloading %s to %s", download_url, filename_with_path)
+            self._add_installed_archive(version, download_url, filename, digests)
             return filename_with_path
 
         raise_runtime_error(f"Error downloading file {filename}, got status code: {data.status_code}")
         return None
 
+    @staticmethod
+    def _get_range_start(response):
+        """:returns: First byte of the Content-Range of a partial response, or None if it has no valid Content-Range."""
+        content_range = re.match(r"bytes (\d+)-", response.headers.get("Content-Range", ""))
+        return int(content_range.group(1)) if content_range else None
+
+    @staticmethod
+    def _write_response(response, fileobj, show_progress_bar, hashers=None):
+        chunk_size = 1024
+        chunks = response.iter_content(chunk_size)
+        if show_progress_bar:
+            expected_size = int(response.headers.get("Content-Length", 0))
+            chunks = tqdm.tqdm(chunks, total=int(expected_size / chunk_size) or None, unit="kb")
+
+        written = 0
+        for chunk in chunks:
+            fileobj.write(chunk)
+            for hasher in (hashers or {}).values():
+                hasher.update(chunk)
+            written += len(chunk)
+        return written
+
     @staticmethod
     def _generate_archive_details(dl_path, filename):
         if filename.lower().endswith(".tar.gz"):
@@ -279,51 +614,154 @@ class WebDriverManagerBase:
         else:
             raise_runtime_error(f"Unknown archive format: {filename}")
 
-    def download_and_install(self, version="latest", show_progress_bar=True):
+    @staticmethod
+    def _is_driver_member(name, driver_filename):
+        basename = name.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]
+        if isinstance(driver_filename, str):
+            return basename == driver_filename
+        return basename in driver_filename
+
+    @staticmethod
+    def _member_path(extract_dir, name):
+        # Only keep the plain path components of the archive member so nothing gets written outside extract_dir
+        parts = [part for part in PurePosixPath(name.replace("\\", "/")).parts if part not in ["/", ".", ".."]]
+        return extract_dir.joinpath(*parts)
+
+    def _extract_driver(self, archive_file, archive_type, extract_dir, driver_filename):
         """
-        Method for downloading a web driver binary, extracting it into the download directory and creating a symlink
-        to the binary in the link directory.
+        Extracts only the driver binary from the archive instead of the whole archive.
 
-        :param version: String representing the version of the web driver binary to download.  For example, "2.38".
-                        Default if no version is specified is "latest".  The version string should match the version
-                        as specified on the download page of the webdriver binary.
-        :param show_progress_bar: Boolean (default=install_requires) indicating if a progress bar should be shown in
-                                  the console.
-        :returns: Tuple containing the path + filename to [0] the extracted binary, and [1] the symlink to the
-                  extracted binary.
+        :returns: Path of the extracted driver binary or None if the archive does not contain it.
         """
-        archive_type = 0
-        actual_driver_filename = None
+        if archive_type == 1:
+            with tarfile.open(archive_file, mode="r:*") as tar:
+                for member in tar.getmembers():
+                    if member.isfile() and self._is_driver_member(member.name, driver_filename):
+                        target = self._member_path(extract_dir, member.name)
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        with tar.extractfile(member) as src, open(target, mode="wb") as dest:
+                            shutil.copyfileobj(src, dest)
+                        os.chmod(target, member.mode & 0o777)
+                        LOGGER.debug("Extracted %s from %s", member.name, archive_file)
+                        return target
+        elif archive_type == 2:
+            with zipfile.ZipFile(archive_file, mode="r") as driver_zipfile:
+                for member in driver_zipfile.infolist():
+                    if not member.is_dir() and self._is_driver_member(member.filename, driver_filename):
+                        target = self._member_path(extract_dir, member.filename)
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        with driver_zipfile.open(member) as src, open(target, mode="wb") as dest:
+                            shutil.copyfileobj(src, dest)
+                        mode = (member.external_attr >> 16) & 0o777
+                        if mode:
+                            os.chmod(target, mode)
+                        LOGGER.debug("Extracted %s from %s", member.filename, archive_file)
+                        return target
+        elif archive_type == 3:
+            if self._is_driver_member(archive_file.name, driver_filename):
+                target = extract_dir / archive_file.name
+                shutil.copy2(archive_file, target)
+                return target
+        return None
 
-        driver_filename = self.get_driver_filename()
-        if not driver_filename:
-            raise_runtime_error(f"Error, unable to find appropriate drivername for {self.os_name}.")
+    def _extract_atomically(self, archive_file, archive_type, extract_dir, driver_filename):
+        """
+        Extracts the driver into a temporary sibling of extract_dir and moves it into place only once the driver binary
+        is complete, so extract_dir never contains a partially written driver. An existing extract_dir is kept and only
+        the driver binary in it is replaced.
+        """
+        extract_dir.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_extractions(extract_dir)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{extract_dir.name}.", suffix=".tmp", dir=extract_dir.parent))
+        try:
+            # mkdtemp creates the directory accessible by the owner only, it becomes extract_dir once moved into place
+            os.chmod(tmp_dir, 0o777 & ~get_umask())
+            driver_file = self._extract_driver(archive_file, archive_type, tmp_dir, driver_filename)
+            if not driver_file:
+                return None
+            if not driver_file.is_file() or driver_file.stat().st_size == 0:
+                raise_runtime_error(f"Extracted driver {driver_file.name} from {archive_file} is empty")
+            if self.os_name in ["mac", "linux"]:
+                driver_stat = os.stat(driver_file)
+                os.chmod(driver_file, driver_stat.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+            target = extract_dir / driver_file.relative_to(tmp_dir)
+            if extract_dir.exists():
+                # Replacing only the binary is a single atomic rename, so links to it never point to a missing file
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(driver_file, target)
+            else:
+                os.replace(tmp_dir, extract_dir)
+            LOGGER.debug("Moved extracted driver into %s", extract_dir)
+            return target
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _remove_stale_extractions(self, extract_dir):
+        """Removes temporary directories left next to extract_dir by extractions that crashed."""
+        for leftover in extract_dir.parent.glob(f".{extract_dir.name}.*"):
+            if leftover.suffix not in (".tmp", ".old"):
+                continue
+            try:
+                # Another installer of a different os or bitness might be extracting right now
+                if time.time() - leftover.stat().st_mtime > self.lock_timeout:
+                    LOGGER.debug("Removing leftover %s", leftover)
+                    shutil.rmtree(leftover, ignore_errors=True)
+            except OSError:
+                pass
+
+    def _extraction_key(self, version, archive_file):
+        entry = self.archive_manifest.get(self._archive_key(version)) or {}
+        if entry.get("filename") == archive_file.name and "sha256" in entry:
+            return entry["sha256"]
+        archive_stat = archive_file.stat()
+        return f"{archive_file}:{archive_stat.st_size}:{archive_stat.st_mtime_ns}"
+
+    def _get_extracted_driver(self, extraction_key):
+        entry = self.extraction_manifest.get(extraction_key)
+        if not entry:
+            return None
+
+        driver_file = Path(entry["path"])
+        try:
+            driver_stat = driver_file.stat()
+        except OSError:
+            return None
+        if driver_stat.st_size != entry["size"] or driver_stat.st_mtime_ns != entry["mtime"]:
+            return None
+        if self.os_name in ["mac", "linux"] and not os.access(driver_file, os.X_OK):
+            return None
+        return driver_file
+
+    def _add_extracted_driver(self, extraction_key, driver_file):
+        driver_stat = os.stat(driver_file)
+        self.extraction_manifest.set(
+            extraction_key,
+            {"path": str(driver_file), "size": driver_stat.st_size, "mtime": driver_stat.st_mtime_ns},
+        )
+
+    def _download_and_extract(self, version, driver_filename, show_progress_bar):
+        actual_driver_filename = None
+        dl_path = Path(self.get_download_path(version))
 
         force = False
         for _ in range(0, 2):
-            filename_with_path = self.download(version, show_progress_bar=show_progress_bar, force=force)
+            filename_with_path = self._download(version, show_progress_bar=show_progress_bar, force=force)
             filename = filename_with_path.name
-            dl_path = Path(self.get_download_path(version))
 
-            (extract_dir, archive_type) = self._generate_archive_details(dl_path, filename)
-
-            if not extract_dir.exists():
-                extract_dir.mkdir(parents=True, exist_ok=True)
-                LOGGER.debug("Created directory: %s", extract_dir)
+            extract_dir, archive_type = self._generate_archive_details(dl_path, filename)
+            archive_file = dl_path / filename
+            extraction_key = self._extraction_key(version, archive_file)
+            actual_driver_filename = self._get_extracted_driver(extraction_key)
+            if actual_driver_filename:
+                LOGGER.info("Skipping extraction. Driver %s already extracted from %s.", actual_driver_filename, archive_file)
+                break
 
             try:
-                archive_file = dl_path / filename
-                if archive_type == 1:
-                    with tarfile.open(archive_file, mode="r:*") as tar:
-                        tar.extractall(extract_dir)
-                        LOGGER.debug("Extracted files: %s", ", ".join(tar.getnames()))
-                elif archive_type == 2:
-                    with zipfile.ZipFile(archive_file, mode="r") as driver_zipfile:
-                        driver_zipfile.extractall(extract_dir)
-                        # TODO: Get filenames and log debug
-                elif archive_type == 3:
-                    shutil.copy2(archive_file, extract_dir / filename)
-            except (gzip.BadGzipFile, tarfile.TarError, zipfile.BadZipFile):
+                actual_driver_filename = self._extract_atomically(archive_file, archive_type, extract_dir, driver_filename)
+                if actual_driver_filename:
+                    self._add_extracted_driver(extraction_key, actual_driver_filename)
+            except (gzip.BadGzipFile, tarfile.TarError, zipfile.BadZipFile, EOFError):
                 force = True
                 LOGGER.debug(f"Downloaded archive {archive_file} seems to be corrupted - redownloading")
                 continue
@@ -333,12 +771,44 @@ class WebDriverManagerBase:
                 )
             break
 
-        # TODO: Clean up
-        for root, _, files in os.walk(extract_dir):
-            for curr_file in files:
-                if curr_file in driver_filename:
-                    actual_driver_filename = Path(root) / curr_file
-                    break
+        return actual_driver_filename
+
+    @staticmethod
+    def _replace_symlink(symlink_src, symlink_target):
+        """
+        Points symlink_target to symlink_src by renaming a new symlink over it, so the target never goes missing while
+        other processes are looking it up.
+        """
+        tmp_link = symlink_target.with_name(f".{symlink_target.name}.{uuid.uuid4().hex}.tmp")
+        tmp_link.symlink_to(symlink_src)
+        try:
+            os.replace(tmp_link, symlink_target)
+        except OSError:
+            tmp_link.unlink()
+            raise
+
+    def download_and_install(self, version="latest", show_progress_bar=True):
+        """
+        Method for downloading a web driver binary, extracting it into the download directory and creating a symlink
+        to the binary in the link directory.
+
+        :param version: String representing the version of the web driver binary to download.  For example, "2.38".
+                        Default if no version is specified is "latest".  The version string should match the version
+                        as specified on the download page of the webdriver binary.
+        :param show_progress_bar: Boolean (default=install_requires) indicating if a progress bar should be shown in
+                                  the console.
+        :returns: Tuple containing the path + filename to [0] the extracted binary, and [1] the symlink to the
+                  extracted binary.
+        """
+        driver_filename = self.get_driver_filename()
+        if not driver_filename:
+            raise_runtime_error(f"Error, unable to find appropriate drivername for {self.os_name}.")
+
+        version = self._parse_version(version)
+
+        # Only one process at a time downloads and extracts a given driver, the others wait and reuse the result.
+        with self._install_lock(version):
+            actual_driver_filename = self._download_and_extract(version, driver_filename, show_progress_bar)
 
         if not actual_driver_filename:
             LOGGER.warning("Cannot locate binary %s from the archive", driver_filename)
@@ -351,14 +821,13 @@ class WebDriverManagerBase:
             symlink_src = actual_driver_filename
             symlink_target = self.link_path / driver_filename
             if symlink_target.is_symlink() or symlink_target.exists():
-                if symlink_src.samefile(symlink_target):
+                if symlink_target.exists() and symlink_src.samefile(symlink_target):
                     LOGGER.info("Symlink already exists: %s -> %s", symlink_target, symlink_src)
                     return (symlink_src, symlink_target)
 
                 LOGGER.warning("Symlink target %s already exists and will be overwritten.", symlink_target)
-                os.unlink(symlink_target)
 
-            symlink_target.symlink_to(symlink_src)
+            self._replace_symlink(symlink_src, symlink_target)
             LOGGER.info("Created symlink: %s -> %s", symlink_target, symlink_src)
             try:
                 symlink_stat = os.stat(symlink_src)
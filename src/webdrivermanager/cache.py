@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+from .lock import FileLock
+from .misc import LOGGER, get_umask
+from .transport import release_response
+
+DEFAULT_CACHE_TTL = 3600
+
+
+class JsonCache:
+    """Small JSON file backed key/value store where every entry carries the time it was stored."""
+
+    _lock = threading.Lock()
+
+    def __init__(self, path, ttl=DEFAULT_CACHE_TTL):
+        """
+        :param path: Path of the JSON file holding the cached entries.
+        :param ttl: Seconds an entry stays valid. 0 disables lookups, None keeps entries forever.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as fileobj:
+                data = json.load(fileobj)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            LOGGER.debug("Ignoring unreadable cache file %s: %s", self.path, exc)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, data):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+            with os.fdopen(fd, mode="w", encoding="utf-8") as fileobj:
+                json.dump(data, fileobj, indent=1, sort_keys=True)
+            # mkstemp creates the file readable by the owner only, the cache is shared like any other created file
+            os.chmod(tmp_name, 0o666 & ~get_umask())
+            os.replace(tmp_name, self.path)
+        except OSError as exc:
+            LOGGER.debug("Unable to write cache file %s: %s", self.path, exc)
+
+    def get(self, key, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        if ttl == 0:
+            return None
+
+        entry = self._load().get(key)
+        if not entry:
+            return None
+
+        if ttl is not None and time.time() - entry.get("timestamp", 0) > ttl:
+            LOGGER.debug("Cache entry %s has expired", key)
+            return None
+
+        return entry.get("value")
+
+    def get_entry(self, key):
+        """:returns: Tuple of the stored value and its age in seconds regardless of ttl, or None if key is not stored."""
+        entry = self._load().get(key)
+        if not entry:
+            return None
+        return (entry.get("value"), time.time() - entry.get("timestamp", 0))
+
+    def _update(self, update):
+        """
+        Reads, modifies and writes back the cache file while holding a lock file next to it, so concurrent processes
+        sharing the cache do not overwrite each others entries.
+
+        :param update: Function modifying the loaded data in place, returning True if the data needs to be saved.
+        """
+        with self._lock:
+            try:
+                file_lock = FileLock(self.path.with_name(f".{self.path.name}.lock")).acquire()
+            except OSError as exc:
+                LOGGER.debug("Unable to lock cache file %s: %s", self.path, exc)
+                return
+            try:
+                data = self._load()
+                if update(data):
+                    self._save(data)
+            finally:
+                file_lock.release()
+
+    def set(self, key, value):
+        def update(data):
+            data[key] = {"value": value, "timestamp": time.time()}
+            return True
+
+        self._update(update)
+
+    def delete(self, key):
+        self._update(lambda data: data.pop(key, None) is not None)
+
+
+class HttpMetadataCache:
+    """
+    Metadata documents parsed from HTTP responses, stored with the validators of the response.
+
+    Requests for a stored document are sent as conditional requests. When the server answers 304 Not Modified, the value
+    parsed from the earlier response is reused without downloading or parsing the document again.
+    """
+
+    def __init__(self, directory):
+        """:param directory: Directory holding one JSON file per cached document."""
+        self.directory = Path(directory)
+
+    def _entry(self, url, params):
+        key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        return JsonCache(self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json", ttl=None)
+
+    def get(self, get, url, parse, params=None, headers=None, **kwargs):
+        """
+        :param get: Function making the request with requests.get() arguments, such as requests.Session.get.
+        :param url: URL of the document.
+        :param parse: Function returning a JSON serializable value parsed from a 200 response.
+        :param params: Query parameters of the request, part of the cache key.
+        :param headers: Additional request headers.
+        :returns: Tuple of the response and the parsed value. The value is None unless the response is 200 or a 304 for a
+                  cached document. The response is None if get returned None.
+        """
+        entry = self._entry(url, params)
+        cached = entry.get("document")
+        headers = dict(headers or {})
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = get(url, params=params, headers=headers, **kwargs)
+        if response is None:
+            return (None, None)
+        if response.status_code != 200:
+            release_response(response)
+            if response.status_code == 304 and cached:
+                LOGGER.debug("%s has not been modified, using cached metadata", url)
+                return (response, cached["value"])
+            return (response, None)
+
+        try:
+            value = parse(response)
+        finally:
+            release_response(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            entry.set("document", {"etag": etag, "last_modified": last_modified, "value": value})
+        return (response, value)
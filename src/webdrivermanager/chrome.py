@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
-import requests
 import re
 from pathlib import Path
+from urllib.parse import urlparse
 from .base import WebDriverManagerBase
+from .index import DriverIndex, DriverRecord
+from .listing import GCSJsonListing
 from .misc import LOGGER, raise_runtime_error, get_output
 
 
@@ -10,7 +12,17 @@ class ChromeDriverManager(WebDriverManagerBase):
     """Class for downloading the Google Chrome WebDriver."""
 
     chrome_driver_base_url = "https://www.googleapis.com/storage/v1/b/chromedriver"
-
+    # Chrome for Testing JSON endpoints, chromedriver 115 and newer is only published there.
+    chrome_for_testing_url = "https://googlechromelabs.github.io/chrome-for-testing"
+    chrome_for_testing_first_major = 115
+    _cft_index = None
+    _index = None
+    _indexed_versions = None
+    _listing = None
+    download_name_pattern = r"([\d.]+)/chromedriver_(linux|mac|win)_?(\w+)\.zip"
+    cft_platform_pattern = r"(linux|mac|win)-?(\w+)"
+
+    driver_name = "chrome"
     driver_filenames = {
         "win": "chromedriver.exe",
         "mac": "chromedriver",
@@ -36,7 +48,7 @@ class ChromeDriverManager(WebDriverManagerBase):
 
     def get_download_path(self, version="latest"):
         version = self._parse_version(version)
-        return self.download_root / "chrome" / version
+        return self.download_root / self.driver_name / version
 
     def get_download_url(self, version="latest"):
         """
@@ -50,7 +62,9 @@ class ChromeDriverManager(WebDriverManagerBase):
         version = self._parse_version(version)
         LOGGER.debug("Detected OS: %sbit %s", self.bitness, self.os_name)
 
-        chrome_driver_objects = requests.get(self.chrome_driver_base_url + "/o").json()
+        if self._is_chrome_for_testing(version):
+            return self._get_indexed_download(self._get_cft_index(), version, *self._get_cft_platform())
+
         # chromedriver only has 64 bit versions of mac and 32bit versions of windows. For now.
         if self.os_name == "win":
             local_bitness = "32"
@@ -59,35 +73,96 @@ class ChromeDriverManager(WebDriverManagerBase):
         else:
             local_bitness = self.bitness
 
-        matcher = r"{0}/.*{1}{2}.*".format(version, self.os_name, local_bitness)
-
-        entry = [obj for obj in chrome_driver_objects["items"] if re.match(matcher, obj["name"])]
-        if not entry:
-            raise_runtime_error(f"Error, unable to find appropriate download for {self.os_name}{self.bitness}.")
-
-        url = entry[0]["mediaLink"]
-        filename = Path(entry[0]["name"]).name
-        return (url, filename)
+        return self._get_indexed_download(self._get_version_index(version), version, self.os_name, local_bitness)
+
+    def _get_listing(self):
+        if self._listing is None:
+            self._listing = GCSJsonListing(self.session, self.chrome_driver_base_url, http_cache=self.http_cache)
+        return self._listing
+
+    def _get_version_index(self, version):
+        """Lists the objects of a version once and adds its downloads to the index."""
+        if self._index is None:
+            self._index = DriverIndex()
+            self._indexed_versions = set()
+        if version not in self._indexed_versions:
+            # Only list objects of the requested version
+            for obj in self._get_listing().list(prefix=f"{version}/").objects:
+                match = re.fullmatch(self.download_name_pattern, obj.name)
+                if match:
+                    self._index.add(*match.groups(), DriverRecord(obj.url, Path(obj.name).name, obj.md5))
+            self._indexed_versions.add(version)
+        return self._index
+
+    def _get_release_file(self, name):
+        """:returns: Tuple of the response and the text of the release file, text is None if it could not be read."""
+        # alt=media returns the object contents directly instead of its metadata, saving a second request.
+        return self.http_cache.get(
+            self.session.get, f"{self.chrome_driver_base_url}/o/{name}", lambda resp: resp.text.strip(), params={"alt": "media"}
+        )
+
+    def _is_chrome_for_testing(self, version):
+        major = version.split(".")[0]
+        return major.isdigit() and int(major) >= self.chrome_for_testing_first_major
+
+    def _get_cft_platform(self):
+        """:returns: Tuple of os name and architecture of the Chrome for Testing platform matching current os."""
+        if self.os_name == "mac":
+            return ("mac", "arm64" if self.get_mac_cpu_type() == "m1" else "x64")
+        return (self.os_name, self.bitness)
+
+    def _get_cft_json(self, name, parse=lambda resp: resp.json()):
+        resp, value = self.http_cache.get(self.session.get, f"{self.chrome_for_testing_url}/{name}", parse)
+        if value is None:
+            raise_runtime_error(f"Error, unable to get {name}, got code: {resp.status_code}")
+        return value
+
+    def _get_cft_index(self):
+        """Fetches the Chrome for Testing version list once and indexes its chromedriver downloads."""
+        if self._cft_index is None:
+            downloads = self._get_cft_json("known-good-versions-with-downloads.json", parse=self._parse_cft_downloads)
+            self._cft_index = DriverIndex()
+            for version, platform_name, url in downloads:
+                platform = re.fullmatch(self.cft_platform_pattern, platform_name)
+                if platform:
+                    self._cft_index.add(version, *platform.groups(), DriverRecord(url, Path(urlparse(url).path).name, None))
+        return self._cft_index
+
+    @staticmethod
+    def _parse_cft_downloads(resp):
+        """:returns: List of (version, platform, url) of chromedriver downloads, the rest of the document is dropped."""
+        return [
+            (entry["version"], download["platform"], download["url"])
+            for entry in resp.json()["versions"]
+            for download in entry.get("downloads", {}).get("chromedriver", [])
+        ]
 
     def get_latest_version(self):
-        resp = requests.get(self.chrome_driver_base_url + "/o/LATEST_RELEASE")
-        if resp.status_code != 200:
-            raise_runtime_error(f"Error, unable to get version number for latest release, got code: {resp.status_code}")
-
-        latest_release = requests.get(resp.json()["mediaLink"])
-        return latest_release.text
+        channels = self._get_cft_json("last-known-good-versions.json")["channels"]
+        return channels["Stable"]["version"]
 
     def get_compatible_version(self):
         browser_version = self._get_browser_version()
-        resp = requests.get(self.chrome_driver_base_url + "/o/LATEST_RELEASE_" + browser_version)
-
-        if resp.status_code != 200:
+        if self._is_chrome_for_testing(browser_version):
+            versions = [
+                version
+                for version in self._get_cft_index().versions(*self._get_cft_platform())
+                if version.startswith(f"{browser_version}.")
+            ]
+            if not versions:
+                raise_runtime_error(
+                    f"Error, unable to find chromedriver for Chrome {browser_version} on {self.os_name}{self.bitness}"
+                )
+            return versions[-1]
+
+        resp, version = self._get_release_file("LATEST_RELEASE_" + browser_version)
+
+        if version is None:
             raise_runtime_error(
                 f"Error, unable to get version number for release {browser_version}, got code: {resp.status_code}"  # NOQA: C812
             )
 
-        latest_release = requests.get(resp.json()["mediaLink"])
-        return latest_release.text
+        return version
 
     def _get_browser_version(self):
         commands = self.chrome_version_commands.get(self.os_name)
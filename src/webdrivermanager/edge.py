@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
-import requests
 import re
 import os
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from .base import WebDriverManagerBase
 from .misc import LOGGER, raise_runtime_error
 
@@ -11,6 +10,7 @@ from .misc import LOGGER, raise_runtime_error
 class EdgeDriverManager(WebDriverManagerBase):
     """Class for downloading the Edge WebDriver."""
 
+    driver_name = "edge"
     driver_filenames = {
         "win": ["MicrosoftWebDriver.exe", "msedgedriver.exe"],
         "mac": None,
@@ -18,10 +18,11 @@ class EdgeDriverManager(WebDriverManagerBase):
     }
 
     edge_driver_base_url = "https://developer.microsoft.com/en-us/microsoft-edge/tools/webdriver/"
+    _release_table = None
 
     def get_download_path(self, version="latest"):
         version = self._parse_version(version)
-        return self.download_root / "edge" / version
+        return self.download_root / self.driver_name / version
 
     def get_download_url(self, version="latest"):
         """
@@ -35,48 +36,63 @@ class EdgeDriverManager(WebDriverManagerBase):
         version = self._parse_version(version)
         LOGGER.debug("Detected OS: %sbit %s", self.bitness, self.os_name)
 
-        # TODO: handle error 500 by sleep & retry here
-        resp = requests.get(self.edge_driver_base_url)
-        if resp.status_code != 200:
-            raise_runtime_error(f"Error, unable to get version number for latest release, got code: {resp.status_code}")
-
-        url = self._get_download_url(resp, version)
+        url = self._get_download_url(self._get_release_table(), version)
+        if not url:
+            raise_runtime_error(f"Error, unable to find appropriate download for {version} {self.os_name}{self.bitness}.")
         return (url, os.path.split(urlparse(url).path)[1])
 
     def get_latest_version(self):
-        # TODO: handle error 500 by sleep & retry here
-        resp = requests.get(self.edge_driver_base_url)
-        if resp.status_code != 200:
-            raise_runtime_error(f"Error, unable to get version number for latest release, got code: {resp.status_code}")
-
-        return self._get_version_number(resp)
+        return self._get_release_table()["latest"]
 
     def get_compatible_version(self):
         raise NotImplementedError
 
-    def _get_download_url(self, body, version):
-        try:
-            tree = BeautifulSoup(body.text, "html.parser")
-            mstr = f"Release {version}"
-            link_texts = tree.find_all("a", string=re.compile(mstr))
-            if "index.html" in link_texts[0]["href"]:
-                local_bitness = self.bitness
-                if local_bitness == "32":
-                    local_bitness = "86"
-                mstr = f"WebDriver for release number {version} x{local_bitness}"
-                link_texts = tree.find_all("a", {"aria-label": re.compile(mstr)})
-            return link_texts[0]["href"]
-        except Exception:
-            return None
-
-    def _get_version_number(self, body):
-        try:
-            tree = BeautifulSoup(body.text, "html.parser")
-            link_texts = tree.find_all("a", string=re.compile("Release "))
-            results = re.findall(r"\"WebDriver for release number ([\d\.]+)\"", str(link_texts[0]))
-            if bool(results and results[0]):
-                return results[0]
-
-            return None
-        except Exception:
-            return None
+    def _get_release_table(self):
+        """
+        Parses the WebDriver page once into a table of releases, which is cached under download_root.
+
+        :returns: Dict with "latest" version and "releases" mapping version -> {"release": link of the release, "86"/"64":
+                  download links of x86/x64 builds}.
+        """
+        if self._release_table is not None:
+            return self._release_table
+
+        cache_key = f"{self.driver_name}:releases"
+        table = None if self.refresh else self.index_cache.get(cache_key)
+        if table is None:
+            # TODO: handle error 500 by sleep & retry here
+            resp, table = self.http_cache.get(
+                self.session.get, self.edge_driver_base_url, lambda resp: self._parse_release_table(resp.text)
+            )
+            if table is None:
+                raise_runtime_error(f"Error, unable to get version number for latest release, got code: {resp.status_code}")
+            self.index_cache.set(cache_key, table)
+
+        self._release_table = table
+        return table
+
+    def _parse_release_table(self, text):
+        # Only anchors carry release information, skip building the tree for the rest of the page
+        tree = BeautifulSoup(text, "html.parser", parse_only=SoupStrainer("a"))
+        latest = None
+        releases = {}
+        for anchor in tree.find_all("a", href=True):
+            label = anchor.get("aria-label", "")
+            release = re.search(r"Release ([\d\.]+)", anchor.string or "")
+            if release:
+                releases.setdefault(release.group(1), {}).setdefault("release", anchor["href"])
+                if latest is None:
+                    latest_label = re.fullmatch(r"WebDriver for release number ([\d\.]+)", label)
+                    latest = latest_label.group(1) if latest_label else None
+                continue
+
+            build = re.fullmatch(r"WebDriver for release number ([\d\.]+) x(\d+)", label)
+            if build:
+                releases.setdefault(build.group(1), {}).setdefault(build.group(2), anchor["href"])
+        return {"latest": latest, "releases": releases}
+
+    def _get_download_url(self, table, version):
+        release = table["releases"].get(version, {})
+        if "index.html" in release.get("release", ""):
+            return release.get("86" if self.bitness == "32" else self.bitness)
+        return release.get("release")
@@ -1,20 +1,24 @@
 # -*- coding: utf-8 -*-
-import requests
 import re
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from .base import WebDriverManagerBase
+from .index import DriverIndex, DriverRecord
+from .listing import AzureBlobListing
 from .misc import LOGGER, raise_runtime_error, versiontuple
 
 
 class EdgeChromiumDriverManager(WebDriverManagerBase):
     """Class for downloading Edge Chromium WebDriver."""
 
-    edgechromium_driver_base_url = (
-        "https://msedgewebdriverstorage.blob.core.windows.net/edgewebdriver?maxresults=1000&comp=list&timeout=60000"
-    )
-    _drivers = None
-    _versions = None
+    edgechromium_driver_base_url = "https://msedgewebdriverstorage.blob.core.windows.net/edgewebdriver"
+    _index = None
+    _index_complete = False
+    _listing = None
+    download_name_pattern = r"([\d.]+)/edgedriver_([a-z]+)(\w+)\.zip"
+    # Concurrent requests used when listing the whole container
+    listing_workers = 8
+    driver_name = "edgechromium"
     driver_filenames = {
         "win": "msedgedriver.exe",
         "mac": "msedgedriver",
@@ -23,7 +27,7 @@ class EdgeChromiumDriverManager(WebDriverManagerBase):
 
     def get_download_path(self, version="latest"):
         version = self._parse_version(version)
-        return self.download_root / "edgechromium" / version
+        return self.download_root / self.driver_name / version
 
     def get_download_url(self, version="latest"):
         """
@@ -36,54 +40,71 @@ class EdgeChromiumDriverManager(WebDriverManagerBase):
         """
         version = self._parse_version(version)
 
-        if not self._drivers:
-            self._populate_cache(self.edgechromium_driver_base_url)
-
         LOGGER.debug("Detected OS: %sbit %s", self.bitness, self.os_name)
-        local_osname = self.os_name
-        matcher = r".*/{0}/edgedriver_{1}{2}".format(version, local_osname, self.bitness)
-        entry = [entry for entry in self._drivers if re.match(matcher, entry)]
-        if not entry:
-            raise_runtime_error(f"Error, unable to find appropriate download for {self.os_name}{self.bitness}.")
-
-        url = entry[0]
-        filename = Path(entry[0]).name
-        return (url, filename)
+        return self._get_indexed_download(self._get_version_index(version), version, self.os_name, self.bitness)
 
     def get_latest_version(self):
-        if self._drivers is None or self._versions is None:
-            self._populate_cache(self.edgechromium_driver_base_url)
-        return ".".join(map(str, max(self._versions)))
+        if self._index_complete:
+            return self._index.latest(self.os_name, self.bitness)
+
+        # Only list the version "directories" and then the contents of the newest ones, instead of every blob.
+        prefixes = self._get_listing().list(delimiter="/").prefixes
+        versions = sorted(
+            (versiontuple(prefix.rstrip("/")) for prefix in prefixes if re.fullmatch(r"[\d.]+/", prefix)),
+            reverse=True,
+        )
+        for version in versions:
+            version = ".".join(map(str, version))
+            if self._get_version_index(version).get(version, self.os_name, self.bitness):
+                return version
+
+        raise_runtime_error(f"Error, unable to find any edgedriver for {self.os_name}{self.bitness}.")
 
     def get_compatible_version(self):
         raise NotImplementedError
 
-    def _extract_ver(self, s):
-        matcher = r".*\/edgewebdriver\/([\d.]+)\/edgedriver_.*\.zip"
-        ret = re.match(matcher, s)
-        return ret.group(1)
-
-    def _populate_cache(self, url):
-        urls = []
-        at_the_end = False
-        pagination = ""
-        while not at_the_end:
-            local_url = f"{url}{pagination}"
-            print(f"URL {local_url}")
-            resp = requests.get(local_url)
-            if resp.status_code != 200:
-                raise_runtime_error(f"Error, unable to get version number for latest release, got code: {resp.status_code}")
-
-            soup = BeautifulSoup(resp.text, "lxml")
-            urls.extend(soup.find_all("url"))
-
-            next_marker = soup.find("nextmarker").text
-            if next_marker:
-                pagination = f"&marker={next_marker}"
-            else:
-                at_the_end = True
-
-        arch_matcher = f"{self.os_name}{self.bitness}"
-        drivers = filter(lambda entry: f"edgedriver_{arch_matcher}" in entry.contents[0], urls)
-        self._drivers = list(map(lambda entry: entry.contents[0], drivers))
-        self._versions = set(map(lambda entry: versiontuple(self._extract_ver(entry)), self._drivers))
+    def _get_listing(self):
+        if self._listing is None:
+            arch_matcher = f"edgedriver_{self.os_name}{self.bitness}"
+            self._listing = AzureBlobListing(
+                self.session,
+                self.edgechromium_driver_base_url,
+                match=lambda name: arch_matcher in name,
+                cache={},
+                http_cache=self.http_cache,
+            )
+        return self._listing
+
+    def _add_to_index(self, blobs):
+        if self._index is None:
+            self._index = DriverIndex()
+        for blob in blobs:
+            match = re.fullmatch(self.download_name_pattern, blob.name)
+            if match:
+                self._index.add(*match.groups(), DriverRecord(blob.url, Path(blob.name).name, blob.md5))
+        return self._index
+
+    def _get_version_index(self, version):
+        if self._index_complete:
+            return self._index
+        return self._add_to_index(self._get_listing().list(prefix=f"{version}/").objects)
+
+    def _populate_cache(self):
+        # Partition the listing by major version and fetch the partitions concurrently instead of paging serially
+        prefixes = self._get_listing().list(delimiter="/").prefixes
+        majors = sorted({prefix.split(".")[0] for prefix in prefixes if re.fullmatch(r"[\d.]+/", prefix)}, key=int)
+        with ThreadPoolExecutor(max_workers=self.listing_workers) as executor:
+            partitions = list(executor.map(lambda major: self._get_listing().list(prefix=f"{major}.").objects, majors))
+
+        self._add_to_index(blob for partition in partitions for blob in partition)
+        self._index_complete = True
+
+    def get_available_versions(self):
+        """
+        Method for listing every version of the Edge Chromium WebDriver available for current os and bitness.
+
+        :returns: List of version strings, oldest first.
+        """
+        if not self._index_complete:
+            self._populate_cache()
+        return self._index.versions(self.os_name, self.bitness)
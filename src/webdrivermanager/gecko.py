@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
-import requests
 import os
 import re
 from urllib.parse import urlparse
 from .base import WebDriverManagerBase
-from .misc import LOGGER, raise_runtime_error, get_output
+from .index import DriverIndex, DriverRecord
+from .misc import LOGGER, raise_runtime_error, get_output, versiontuple
 
 
 class GeckoDriverManager(WebDriverManagerBase):
@@ -12,7 +12,14 @@ class GeckoDriverManager(WebDriverManagerBase):
 
     gecko_driver_releases_url = "https://api.github.com/repos/mozilla/geckodriver/releases/"
     fallback_url = "https://github.com/mozilla/geckodriver/releases/"
-
+    # geckodriver-v0.33.0-linux64.tar.gz, geckodriver-v0.33.0-macos-aarch64.tar.gz, geckodriver-v0.33.0-win32.zip
+    asset_name_pattern = r"geckodriver-[^-]+-(linux|macos|win)-?(\w*)\.(?:tar\.gz|zip)"
+    asset_os_names = {"linux": "linux", "macos": "mac", "win": "win"}
+    _release_index = None
+    _release_tags = None
+    _latest_release = None
+
+    driver_name = "gecko"
     driver_filenames = {
         "win": "geckodriver.exe",
         "mac": "geckodriver",
@@ -35,7 +42,7 @@ class GeckoDriverManager(WebDriverManagerBase):
 
     def get_download_path(self, version="latest"):
         version = self._parse_version(version)
-        return self.download_root / "gecko" / version
+        return self.download_root / self.driver_name / version
 
     def get_download_url(self, version="latest"):
         """
@@ -47,23 +54,106 @@ class GeckoDriverManager(WebDriverManagerBase):
         :returns: The download URL for the Gecko (Mozilla Firefox) driver binary.
         """
         version = self._parse_version(version)
-        releases_url = f"{self.gecko_driver_releases_url}tags/{version}"
+        index = self._get_release_index()
+        if index is not None and version not in self._release_tags:
+            # Release published after the cached index was built
+            index = self._get_release_index(refresh=True)
 
-        LOGGER.debug("Attempting to access URL: %s", releases_url)
-        response = requests.get(releases_url)
-        if response.ok:
-            url = self._parse_github_api_response(version, response)
-        elif response.status_code == 403:
+        if index is None or version not in self._release_tags:
             url = self._parse_github_page(version)
-        else:
-            raise_runtime_error(
-                f"Error, unable to get info for gecko driver {version} release. Status code: {response.status_code}. Error message: {response.text}"  # NOQA: C812
-            )
+            if not url:
+                raise_runtime_error(f"Error, unable to get info for gecko driver {version} release.")
+            return (url, os.path.split(urlparse(url).path)[1])
 
-        return (url, os.path.split(urlparse(url).path)[1])
+        return self._get_indexed_download(index, version, *self._get_release_platform(index, version))
 
     def get_latest_version(self):
-        return self._get_latest_version_with_github_page_fallback(self.gecko_driver_releases_url, self.fallback_url, "latest")
+        index = self._get_release_index()
+        if index is None:
+            return self._get_latest_version_from_github_page(self.fallback_url)
+        return self._latest_release
+
+    def _get_release_platform(self, index, version):
+        if self.os_name == "mac":
+            # Releases before arm builds were published run on Apple silicon as x64 binaries
+            if self.get_mac_cpu_type() == "m1" and index.get(version, "mac", "aarch64"):
+                return ("mac", "aarch64")
+            return ("mac", "64")
+        return (self.os_name, self.bitness)
+
+    def _fetch_releases(self):
+        """
+        Reads every release from the paginated GitHub releases listing.
+
+        :returns: List of {"tag", "prerelease", "assets"} dicts where assets maps file names to download urls, or None
+                  when GitHub API is rate limited.
+        """
+        releases = []
+        url = self.gecko_driver_releases_url.rstrip("/")
+        params = {"per_page": 100}
+        while url:
+            LOGGER.debug("Attempting to access URL: %s", url)
+            # Conditional requests answered with 304 do not count against the GitHub API rate limit
+            response, page = self.http_cache.get(self._github_api_get, url, self._parse_release_page, params=params)
+            if response is None:
+                return None
+            if page is None:
+                raise_runtime_error(
+                    f"Error, unable to list gecko driver releases. Status code: {response.status_code}. Error message: {response.text}"  # NOQA: C812
+                )
+
+            releases.extend(page["releases"])
+            url = page["next"]
+            # The next link already carries the query parameters
+            params = None
+        return releases
+
+    def _parse_release_page(self, response):
+        releases = []
+        for release in response.json():
+            if release.get("draft"):
+                continue
+            assets = {
+                asset["name"]: asset["browser_download_url"]
+                for asset in release.get("assets", [])
+                if re.fullmatch(self.asset_name_pattern, asset["name"])
+            }
+            releases.append({"tag": release["tag_name"], "prerelease": release.get("prerelease", False), "assets": assets})
+        return {"releases": releases, "next": response.links.get("next", {}).get("url")}
+
+    def _get_release_index(self, refresh=False):
+        """
+        Builds the release index from the release listing, which is fetched once and cached under download_root.
+
+        :returns: DriverIndex keyed by (tag, os name, architecture), or None when GitHub API can not be used.
+        """
+        if self._release_index is not None and not refresh:
+            return self._release_index
+
+        cache_key = f"{self.driver_name}:releases"
+        releases = None if refresh or self.refresh else self.index_cache.get(cache_key)
+        if releases is None:
+            releases = self._fetch_releases()
+            if releases is not None:
+                self.index_cache.set(cache_key, releases)
+            else:
+                # Rate limited, an expired index still answers lookups without scraping release pages
+                cached = self.index_cache.get_entry(cache_key)
+                if cached is None:
+                    return None
+                releases, age = cached
+                LOGGER.debug("Using %d seconds old gecko release index", age)
+
+        index = DriverIndex()
+        for release in releases:
+            for name, url in release["assets"].items():
+                os_name, arch = re.fullmatch(self.asset_name_pattern, name).groups()
+                index.add(release["tag"], self.asset_os_names[os_name], arch or "64", DriverRecord(url, name, None))
+        stable = [release["tag"] for release in releases if not release["prerelease"]]
+        self._latest_release = max(stable, key=lambda tag: versiontuple(tag.lstrip("v"))) if stable else None
+        self._release_tags = {release["tag"] for release in releases}
+        self._release_index = index
+        return index
 
     def get_compatible_version(self):
         # Map browser version to webdriver version
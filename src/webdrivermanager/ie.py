@@ -1,19 +1,21 @@
 # -*- coding: utf-8 -*-
-import requests
 import re
 from pathlib import Path
-from bs4 import BeautifulSoup
 from .base import WebDriverManagerBase
-from .misc import LOGGER, raise_runtime_error, versiontuple
+from .index import DriverIndex, DriverRecord
+from .listing import GCSXmlListing
+from .misc import LOGGER
 
 
 class IEDriverManager(WebDriverManagerBase):
     """Class for downloading Internet Explorer WebDriver."""
 
     ie_driver_base_url = "https://selenium-release.storage.googleapis.com"
-    _drivers = None
-    _versions = None
+    _index = None
+    _listing = None
+    download_name_pattern = r".*/IEDriverServer_(x64|Win32)_(\d+\.\d+\.\d+)\.zip"
 
+    driver_name = "ie"
     driver_filenames = {
         "win": "IEDriverServer.exe",
         "mac": None,
@@ -22,7 +24,7 @@ class IEDriverManager(WebDriverManagerBase):
 
     def get_download_path(self, version="latest"):
         version = self._parse_version(version)
-        return self.download_root / "ie" / version
+        return self.download_root / self.driver_name / version
 
     def get_download_url(self, version="latest"):
         """
@@ -34,45 +36,35 @@ class IEDriverManager(WebDriverManagerBase):
         :returns: The download URL for the Internet Explorer driver binary.
         """
         version = self._parse_version(version)
-
-        if not self._drivers:
-            self._populate_cache(self.ie_driver_base_url)
-
         LOGGER.debug("Detected OS: %sbit %s", self.bitness, self.os_name)
-        local_osname = self.os_name
-        if self.bitness == "64":
-            local_osname = "x"
-        elif self.bitness == "32":
-            local_osname = "Win"
-        matcher = r".*/.*_{0}{1}_{2}".format(local_osname, self.bitness, version)
-        entry = [entry for entry in self._drivers if re.match(matcher, entry)]
-
-        if not entry:
-            raise_runtime_error(f"Error, unable to find appropriate download for {self.os_name}{self.bitness}.")
-
-        url = f"{self.ie_driver_base_url}/{entry[0]}"
-        filename = Path(entry[0]).name
-        return (url, filename)
+        return self._get_indexed_download(self._get_index(), version, "win", self.bitness)
 
     def get_latest_version(self):
-        if self._drivers is None or self._versions is None:
-            self._populate_cache(self.ie_driver_base_url)
-        return ".".join(map(str, max(self._versions)))
+        return self._get_index().latest()
 
     def get_compatible_version(self):
         raise NotImplementedError
 
-    def _extract_ver(self, s):
-        matcher = r".*\/IEDriverServer_(x64|Win32)_(\d+\.\d+\.\d+)\.zip"
-        ret = re.match(matcher, s)
-        return ret.group(2)
-
-    def _populate_cache(self, url):
-        resp = requests.get(url)
-        if resp.status_code != 200:
-            raise_runtime_error(f"Error, unable to get version number for latest release, got code: {resp.status_code}")
-
-        soup = BeautifulSoup(resp.text, "lxml")
-        drivers = filter(lambda entry: "IEDriverServer_" in entry.contents[0], soup.find_all("key"))
-        self._drivers = list(map(lambda entry: entry.contents[0], drivers))
-        self._versions = set(map(lambda entry: versiontuple(self._extract_ver(entry)), self._drivers))
+    def _get_listing(self):
+        if self._listing is None:
+            self._listing = GCSXmlListing(
+                self.session, self.ie_driver_base_url, match=lambda name: "IEDriverServer_" in name, http_cache=self.http_cache
+            )
+        return self._listing
+
+    def _get_index(self):
+        """Lists the bucket once and indexes the downloads by version and bitness."""
+        if self._index is None:
+            index = DriverIndex()
+            for driver in self._get_listing().list().objects:
+                match = re.fullmatch(self.download_name_pattern, driver.name)
+                if match:
+                    arch, version = match.groups()
+                    index.add(
+                        version,
+                        "win",
+                        "64" if arch == "x64" else "32",
+                        DriverRecord(driver.url, Path(driver.name).name, driver.md5),
+                    )
+            self._index = index
+        return self._index
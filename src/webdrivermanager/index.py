@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from bisect import insort
+from collections import namedtuple
+
+from .misc import versiontuple
+
+DriverRecord = namedtuple("DriverRecord", ["url", "filename", "md5"])
+
+
+class DriverIndex:
+    """
+    Driver downloads parsed from a listing, keyed by (version, os name, architecture).
+
+    Listings are parsed into the index once, after which download lookups are dict hits and version queries read
+    presorted version lists.
+    """
+
+    def __init__(self):
+        self._records = {}
+        # (os name, architecture) -> sorted list of (version tuple, version)
+        self._versions = {}
+
+    def __len__(self):
+        return len(self._records)
+
+    def add(self, version, os_name, arch, record):
+        """
+        :param version: Version string of the driver.
+        :param os_name: Name of the os the driver is built for, for example "win".
+        :param arch: Architecture the driver is built for, for example "64".
+        :param record: DriverRecord of the download. The first record added for a key is kept.
+        """
+        key = (version, os_name, arch)
+        if key in self._records:
+            return
+        self._records[key] = record
+        # Release tags such as "v0.33.0" sort by their numeric part
+        insort(self._versions.setdefault((os_name, arch), []), (versiontuple(version.lstrip("v")), version))
+
+    def get(self, version, os_name, arch):
+        """:returns: DriverRecord for the key or None."""
+        return self._records.get((version, os_name, arch))
+
+    def versions(self, os_name=None, arch=None):
+        """
+        :param os_name: Only return versions available for this os name. None returns versions of every os.
+        :param arch: Only return versions available for this architecture. None returns versions of every architecture.
+        :returns: List of version strings, oldest first.
+        """
+        matching = [
+            versions
+            for (indexed_os, indexed_arch), versions in self._versions.items()
+            if os_name in (None, indexed_os) and arch in (None, indexed_arch)
+        ]
+        if len(matching) == 1:
+            return [version for _, version in matching[0]]
+        return [version for _, version in sorted({entry for versions in matching for entry in versions})]
+
+    def latest(self, os_name=None, arch=None):
+        """:returns: Newest version string available for os name and architecture, or None."""
+        versions = self.versions(os_name, arch)
+        return versions[-1] if versions else None
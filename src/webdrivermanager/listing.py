@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+import base64
+from collections import namedtuple
+from typing import Optional
+from xml.etree import ElementTree
+
+from .misc import LOGGER, raise_runtime_error
+from .transport import release_response
+
+ListedObject = namedtuple("ListedObject", ["name", "url", "size", "md5"])
+ListingResult = namedtuple("ListingResult", ["objects", "prefixes"])
+
+
+def _b64_to_hex(value):
+    return base64.b64decode(value).hex() if value else None
+
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+class ObjectStoreListing:
+    """
+    Lists objects of an object store container, following pagination until the end.
+
+    Subclasses implement the request parameters and response parsing of one storage API.
+    """
+
+    def __init__(self, session, base_url, match=None, cache=None, http_cache=None):
+        """
+        :param session: requests.Session used for listing requests.
+        :param base_url: URL of the container listing endpoint. Query parameters already in it are kept.
+        :param match: Optional callable taking an object name. Only objects it returns True for are kept.
+        :param cache: Optional dict-like object for storing listing results by (prefix, delimiter).
+        :param http_cache: Optional HttpMetadataCache. Listing pages are then revalidated with conditional requests and
+                           pages that have not been modified are not parsed again.
+        """
+        self.session = session
+        self.base_url = base_url
+        self.match = match
+        self.cache = cache
+        self.http_cache = http_cache
+
+    def list(self, prefix=None, delimiter=None):
+        """
+        :param prefix: Only list objects whose name starts with prefix.
+        :param delimiter: Group object names containing delimiter after the prefix into ListingResult.prefixes.
+        :returns: ListingResult of listed objects and common prefixes.
+        """
+        cache_key = (prefix, delimiter)
+        if self.cache is not None and cache_key in self.cache:
+            return self.cache[cache_key]
+
+        objects = []
+        prefixes = []
+        marker = None
+        while True:
+            page_objects, page_prefixes, marker = self._get_page(self._params(prefix, delimiter, marker))
+            objects.extend(obj for obj in page_objects if self._matches(obj.name))
+            prefixes.extend(page_prefixes)
+            if not marker:
+                break
+
+        result = ListingResult(objects, prefixes)
+        if self.cache is not None:
+            self.cache[cache_key] = result
+        return result
+
+    def _get_page(self, params):
+        LOGGER.debug("Listing %s with %s", self.base_url, params)
+        if self.http_cache is None:
+            resp = self.session.get(self.base_url, params=params, stream=True)
+            try:
+                page = self._parse_page(resp) if resp.status_code == 200 else None
+            finally:
+                release_response(resp)
+        else:
+            resp, page = self.http_cache.get(self.session.get, self.base_url, self._parse_page, params=params, stream=True)
+        if page is None:
+            raise_runtime_error(f"Error, unable to list {self.base_url}, got code: {resp.status_code}")
+
+        objects, prefixes, marker = page
+        # Pages read from the metadata cache hold plain lists
+        return ([ListedObject(*obj) for obj in objects], prefixes, marker)
+
+    def _matches(self, name):
+        return self.match is None or self.match(name)
+
+    def _params(self, prefix, delimiter, marker):
+        raise NotImplementedError
+
+    def _parse_page(self, resp):
+        """:returns: Tuple of ListedObjects, common prefixes and the marker of the next page or None."""
+        raise NotImplementedError
+
+
+class _XmlListing(ObjectStoreListing):
+    """Streaming parser for XML listings, entries are handled and dropped as soon as they have been read."""
+
+    entry_tag: Optional[str] = None
+    prefix_tag: Optional[str] = None
+    next_marker_tag = "NextMarker"
+
+    def _read_entry(self, elem):
+        raise NotImplementedError
+
+    def _parse_page(self, resp):
+        parser = ElementTree.XMLPullParser(events=("start", "end"))
+        objects = []
+        prefixes = []
+        next_marker = None
+        truncated = False
+        last_name = None
+        parents = []
+        for chunk in resp.iter_content(chunk_size=65536):
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == "start":
+                    parents.append(elem)
+                    continue
+
+                parents.pop()
+                tag = _local_name(elem.tag)
+                if tag == self.entry_tag:
+                    listed = self._read_entry(elem)
+                    last_name = listed.name
+                    objects.append(listed)
+                elif tag == self.prefix_tag:
+                    prefixes.append(self._read_prefix(elem))
+                elif tag == self.next_marker_tag:
+                    next_marker = elem.text
+                elif tag == "IsTruncated":
+                    truncated = (elem.text or "").strip().lower() == "true"
+                else:
+                    continue
+                # Drop handled entries right away so memory use does not grow with the listing
+                if parents:
+                    parents[-1].remove(elem)
+        parser.close()
+        if truncated and not next_marker:
+            # S3 style listings without a delimiter continue from the last listed key
+            next_marker = last_name
+        return (objects, prefixes, next_marker)
+
+    @staticmethod
+    def _find_text(elem, name):
+        for child in elem.iter():
+            if _local_name(child.tag) == name:
+                return child.text
+        return None
+
+    def _read_prefix(self, elem):
+        return self._find_text(elem, "Prefix") or self._find_text(elem, "Name")
+
+
+class GCSJsonListing(ObjectStoreListing):
+    """Google Cloud Storage JSON API, base_url is the bucket resource such as https://www.googleapis.com/storage/v1/b/x"""
+
+    def __init__(
+        self, session, base_url, match=None, cache=None, http_cache=None, fields=("name", "mediaLink", "size", "md5Hash")
+    ):
+        """:param fields: Object fields requested from the API, other fields are left out of the response."""
+        super().__init__(session, f"{base_url}/o", match=match, cache=cache, http_cache=http_cache)
+        self.fields = fields
+
+    def _params(self, prefix, delimiter, marker):
+        params = {"fields": f"items({','.join(self.fields)}),prefixes,nextPageToken"}
+        if prefix:
+            params["prefix"] = prefix
+        if delimiter:
+            params["delimiter"] = delimiter
+        if marker:
+            params["pageToken"] = marker
+        return params
+
+    def _parse_page(self, resp):
+        listing = resp.json()
+        objects = [
+            ListedObject(item["name"], item.get("mediaLink"), int(item.get("size", 0)), _b64_to_hex(item.get("md5Hash")))
+            for item in listing.get("items", [])
+        ]
+        return (objects, listing.get("prefixes", []), listing.get("nextPageToken"))
+
+
+class GCSXmlListing(_XmlListing):
+    """Google Cloud Storage XML API, base_url is the bucket such as https://x.storage.googleapis.com"""
+
+    entry_tag = "Contents"
+    prefix_tag = "CommonPrefixes"
+
+    def _params(self, prefix, delimiter, marker):
+        params = {}
+        if prefix:
+            params["prefix"] = prefix
+        if delimiter:
+            params["delimiter"] = delimiter
+        if marker:
+            params["marker"] = marker
+        return params
+
+    def _read_entry(self, elem):
+        name = self._find_text(elem, "Key")
+        etag = (self._find_text(elem, "ETag") or "").strip('"')
+        # ETag of a non-composite object is the MD5 of its contents
+        md5 = etag if len(etag) == 32 and all(char in "0123456789abcdef" for char in etag) else None
+        return ListedObject(
+            name, f"{self.base_url.split('?')[0].rstrip('/')}/{name}", int(self._find_text(elem, "Size") or 0), md5
+        )
+
+
+class AzureBlobListing(_XmlListing):
+    """Azure Blob Storage, base_url is the container such as https://x.blob.core.windows.net/container"""
+
+    entry_tag = "Blob"
+    prefix_tag = "BlobPrefix"
+
+    def _params(self, prefix, delimiter, marker):
+        params = {"restype": "container", "comp": "list"}
+        if prefix:
+            params["prefix"] = prefix
+        if delimiter:
+            params["delimiter"] = delimiter
+        if marker:
+            params["marker"] = marker
+        return params
+
+    def _read_entry(self, elem):
+        name = self._find_text(elem, "Name")
+        return ListedObject(
+            name,
+            self._find_text(elem, "Url") or f"{self.base_url.split('?')[0].rstrip('/')}/{name}",
+            int(self._find_text(elem, "Content-Length") or 0),
+            _b64_to_hex(self._find_text(elem, "Content-MD5")),
+        )
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+import time
+from pathlib import Path
+
+from .misc import LOGGER, raise_runtime_error
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Exclusive lock backed by a lock file, shared between processes and threads using the same download root.
+
+    Used so that only one installer downloads and extracts a given driver while the others wait and reuse the result.
+    """
+
+    def __init__(self, path, timeout=None, poll_interval=0.1):
+        """
+        :param path: Path of the lock file. Parent directories are created when needed.
+        :param timeout: Seconds to wait for the lock before giving up. None waits forever.
+        :param poll_interval: Seconds between attempts to acquire the lock.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    @staticmethod
+    def _try_lock(fd):
+        try:
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _unlock(fd):
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def acquire(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        started = time.monotonic()
+        waiting = False
+        while not self._try_lock(fd):
+            if not waiting:
+                LOGGER.info("Waiting for another installer holding %s", self.path)
+                waiting = True
+            if self.timeout is not None and time.monotonic() - started > self.timeout:
+                os.close(fd)
+                raise_runtime_error(f"Timed out waiting for lock {self.path}")
+            time.sleep(self.poll_interval)
+        self._fd = fd
+        return self
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            self._unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *args):
+        self.release()
@@ -1,4 +1,6 @@
+import functools
 import logging
+import os
 import subprocess
 import sys
 
@@ -17,6 +19,14 @@ def _inside_virtualenv():
     return hasattr(sys, "real_prefix") or hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
 
 
+@functools.lru_cache(maxsize=None)
+def get_umask():
+    """:returns: File mode creation mask of the process, read once as reading it means setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
 def raise_runtime_error(msg):
     LOGGER.error(msg)
     raise RuntimeError(msg)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (10, 60)
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_HOST_POOL_SIZES = {
+    "https://www.googleapis.com": 10,
+    "https://api.github.com": 4,
+    "https://github.com": 4,
+    "https://msedgewebdriverstorage.blob.core.windows.net": 10,
+    "https://selenium-release.storage.googleapis.com": 4,
+}
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+class TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to every request that does not set one."""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):  # pylint: disable=arguments-differ
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def release_response(response):
+    """Reads what is left of a streamed response body, so its connection goes back to the pool when it is closed."""
+    try:
+        response.content  # noqa: B018
+    except RuntimeError:
+        # Body was already streamed to the end
+        pass
+    finally:
+        response.close()
+
+
+def create_session(
+    timeout=DEFAULT_TIMEOUT,
+    pool_connections=DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    host_pool_sizes=None,
+    max_retries=0,
+):
+    """
+    Creates a session with keep-alive connection pooling that can be shared between driver managers.
+
+    :param timeout: Default timeout for requests, either a number or a (connect, read) tuple.
+    :param pool_connections: Number of hosts the default adapter keeps connection pools for.
+    :param pool_maxsize: Number of connections kept alive per host by the default adapter.
+    :param host_pool_sizes: Dict of URL prefix to pool size for hosts that need their own pool. Defaults to
+                            DEFAULT_HOST_POOL_SIZES.
+    :param max_retries: Retries for failed connections, passed to requests.adapters.HTTPAdapter.
+    :returns: Configured TimeoutSession.
+    """
+    session = TimeoutSession(timeout)
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if host_pool_sizes is None:
+        host_pool_sizes = DEFAULT_HOST_POOL_SIZES
+    for prefix, pool_size in host_pool_sizes.items():
+        session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=max_retries))
+
+    return session
+
+
+def get_session():
+    """Returns the process wide session used by driver managers that were not given one explicitly."""
+    global _shared_session  # pylint: disable=global-statement
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
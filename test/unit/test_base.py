@@ -0,0 +1,357 @@
+import hashlib
+import os
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from .tools import SRC_ROOT, StubServer, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager import WebDriverManagerBase  # noqa: E402 I001
+from webdrivermanager.misc import get_umask  # noqa: E402 I001
+
+
+class FakeDriverManager(WebDriverManagerBase):
+    driver_name = "fake"
+    base_url = "http://localhost.invalid"
+    driver_filenames = {
+        "win": "fakedriver.exe",
+        "mac": "fakedriver",
+        "linux": "fakedriver",
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = {"latest": 0, "url": 0}
+
+    def get_download_path(self, version="latest"):
+        version = self._parse_version(version)
+        return self.download_root / self.driver_name / version
+
+    def get_download_url(self, version="latest"):
+        version = self._parse_version(version)
+        self.calls["url"] += 1
+        return (f"{self.base_url}/{version}/fakedriver_{self.os_name}.zip", f"fakedriver_{self.os_name}.zip")
+
+    def get_latest_version(self):
+        self.calls["latest"] += 1
+        return "1.2.3"
+
+    def get_compatible_version(self):
+        raise NotImplementedError
+
+
+class FakeDriverTest(UnitBaseTest):
+    def make_manager(self, **kwargs):
+        manager = FakeDriverManager(
+            download_root=self.root, link_path=self.make_link_dir(), os_name="linux", bitness="64", **kwargs
+        )
+        archive = self.root / "fake" / "1.2.3" / "fakedriver_linux.zip"
+        if not archive.exists():
+            self.make_zip(archive, {"fakedriver": b"#!/bin/sh\n"})
+        return manager
+
+
+class VersionResolutionTests(FakeDriverTest):
+    def test_latest_is_resolved_once_per_install(self):
+        manager = self.make_manager()
+        binary, link = manager.download_and_install("latest", show_progress_bar=False)
+        self.assertEqual(manager.calls["latest"], 1)
+        self.assertTrue(binary.is_file())
+        self.assertTrue(link.is_symlink())
+
+    def test_compatible_falls_back_to_latest_once(self):
+        manager = self.make_manager()
+        manager.download_and_install("compatible", show_progress_bar=False)
+        self.assertEqual(manager.calls["latest"], 1)
+
+
+class VersionCacheTests(FakeDriverTest):
+    def test_latest_version_is_cached_between_instances(self):
+        self.make_manager().download_and_install("latest", show_progress_bar=False)
+        manager = self.make_manager()
+        manager.download_and_install("latest", show_progress_bar=False)
+        self.assertEqual(manager.calls["latest"], 0)
+
+    def test_refresh_ignores_cached_version(self):
+        self.make_manager().download_and_install("latest", show_progress_bar=False)
+        manager = self.make_manager(refresh=True)
+        manager.download_and_install("latest", show_progress_bar=False)
+        self.assertEqual(manager.calls["latest"], 1)
+
+    def age_cached_latest(self, manager, version, age):
+        key = manager._version_cache_key("latest")
+        manager.version_cache.set(key, version)
+        data = manager.version_cache._load()
+        data[key]["timestamp"] -= age
+        manager.version_cache._save(data)
+
+    def test_stale_latest_version_is_refreshed_in_background(self):
+        manager = self.make_manager(cache_ttl=10, stale_while_revalidate=3600)
+        self.age_cached_latest(manager, "1.2.2", 60)
+        self.assertEqual(manager._parse_version("latest"), "1.2.2")
+        for thread in threading.enumerate():
+            if thread.name.startswith("refresh-"):
+                thread.join()
+        # Refresh is resolved with a manager of its own
+        self.assertEqual(manager.calls["latest"], 0)
+        self.assertEqual(manager._parse_version("latest"), "1.2.3")
+
+    def test_refresh_uses_url_overrides_of_the_instance(self):
+        manager = self.make_manager(cache_ttl=10)
+        manager.base_url = "http://mirror.invalid/1.2.4"
+        key = manager._version_cache_key("latest")
+        with mock.patch.object(FakeDriverManager, "get_latest_version", autospec=True) as get_latest_version:
+            get_latest_version.side_effect = lambda refresher: refresher.base_url.rsplit("/", 1)[1]
+            manager._refresh_cached_version(key)
+        self.assertEqual(manager.version_cache.get(key), "1.2.4")
+
+    def test_detached_refresh_spawns_resolve_only_process(self):
+        manager = self.make_manager(cache_ttl=10, stale_while_revalidate=3600, detached_refresh=True)
+        self.age_cached_latest(manager, "1.2.2", 60)
+        with mock.patch("subprocess.Popen") as popen:
+            self.assertEqual(manager._parse_version("latest"), "1.2.2")
+        cmd = popen.call_args[0][0]
+        self.assertEqual(cmd[1:4], ["-m", "webdrivermanager", "fake:latest"])
+        self.assertIn("--resolve-only", cmd)
+        self.assertIn("--refresh", cmd)
+        self.assertTrue(popen.call_args[1]["start_new_session"])
+        self.assertEqual(manager.calls["latest"], 0)
+
+    def test_detached_refresh_is_spawned_once_while_running(self):
+        manager = self.make_manager(cache_ttl=10, stale_while_revalidate=3600, detached_refresh=True)
+        self.age_cached_latest(manager, "1.2.2", 60)
+        with mock.patch("subprocess.Popen") as popen:
+            for _ in range(3):
+                self.assertEqual(
+                    self.make_manager(cache_ttl=10, stale_while_revalidate=3600, detached_refresh=True)._parse_version("latest"),
+                    "1.2.2",
+                )
+            self.assertEqual(popen.call_count, 1)
+            with mock.patch.object(FakeDriverManager, "version_refresh_timeout", 0):
+                manager._parse_version("latest")
+            self.assertEqual(popen.call_count, 2)
+
+    def test_too_old_latest_version_is_resolved_right_away(self):
+        manager = self.make_manager(cache_ttl=10, stale_while_revalidate=30)
+        self.age_cached_latest(manager, "1.2.2", 60)
+        self.assertEqual(manager._parse_version("latest"), "1.2.3")
+
+
+class InstalledArchiveTests(FakeDriverTest):
+    def test_pinned_version_on_disk_needs_no_url_lookup(self):
+        self.make_manager().download_and_install("1.2.3", show_progress_bar=False)
+        manager = self.make_manager()
+        binary, _ = manager.download_and_install("1.2.3", show_progress_bar=False)
+        self.assertEqual(manager.calls["url"], 0)
+        self.assertTrue(binary.is_file())
+
+    def test_manifest_entry_without_archive_is_ignored(self):
+        manager = self.make_manager()
+        manager.archive_manifest.set(manager._archive_key("1.2.3"), {"url": "http://localhost.invalid", "filename": "gone.zip"})
+        filename = manager.download("1.2.3", show_progress_bar=False)
+        self.assertEqual(manager.calls["url"], 1)
+        self.assertEqual(filename.name, "fakedriver_linux.zip")
+
+
+def ranged(payload):
+    def handler(request):
+        byte_range = request.headers.get("Range")
+        if not byte_range:
+            return (200, {}, payload)
+        start = int(byte_range.split("=")[1].rstrip("-"))
+        return (206, {"Content-Range": f"bytes {start}-{len(payload) - 1}/{len(payload)}"}, payload[start:])
+
+    return handler
+
+
+class DownloadTest(UnitBaseTest):
+    def setUp(self):
+        super().setUp()
+        archive = self.make_zip(self.root / "src.zip", {"fakedriver": b"x" * 4096})
+        self.payload = archive.read_bytes()
+        self.manager = FakeDriverManager(download_root=self.root / "dl", link_path="SKIP", os_name="linux", bitness="64")
+        self.part_file = self.root / "dl" / "fake" / "1.2.3" / "fakedriver_linux.zip.part"
+
+    def download(self, routes):
+        with StubServer(routes) as server:
+            self.manager.base_url = server.url
+            filename = self.manager.download("1.2.3", show_progress_bar=False)
+        return filename, server.requests
+
+
+class ResumableDownloadTests(DownloadTest):
+    def test_download_is_moved_into_place(self):
+        filename, _ = self.download({"/1.2.3/fakedriver_linux.zip": (200, {}, self.payload)})
+        self.assertEqual(filename.read_bytes(), self.payload)
+        self.assertFalse(self.part_file.exists())
+
+    def test_partial_download_is_resumed(self):
+        self.part_file.parent.mkdir(parents=True)
+        self.part_file.write_bytes(self.payload[:100])
+        filename, requests = self.download({"/1.2.3/fakedriver_linux.zip": (None, None, ranged(self.payload))})
+        self.assertEqual(requests[0][1]["Range"], "bytes=100-")
+        self.assertEqual(filename.read_bytes(), self.payload)
+
+    def test_server_without_range_support_restarts(self):
+        self.part_file.parent.mkdir(parents=True)
+        self.part_file.write_bytes(b"garbage")
+        filename, _ = self.download({"/1.2.3/fakedriver_linux.zip": (200, {}, self.payload)})
+        self.assertEqual(filename.read_bytes(), self.payload)
+
+    def test_mismatching_range_restarts(self):
+        def wrong_range(request):
+            if request.headers.get("Range"):
+                return (206, {"Content-Range": f"bytes 0-{len(self.payload) - 1}/{len(self.payload)}"}, self.payload)
+            return (200, {}, self.payload)
+
+        self.part_file.parent.mkdir(parents=True)
+        self.part_file.write_bytes(self.payload[:100])
+        filename, requests = self.download({"/1.2.3/fakedriver_linux.zip": (None, None, wrong_range)})
+        self.assertEqual(len(requests), 2)
+        self.assertNotIn("Range", requests[1][1])
+        self.assertEqual(filename.read_bytes(), self.payload)
+
+    def test_resume_without_checksums_does_not_read_part_file(self):
+        self.manager.verify_checksums = False
+        self.part_file.parent.mkdir(parents=True)
+        self.part_file.write_bytes(self.payload[:100])
+        with mock.patch.object(type(self.manager), "_update_hashers") as update_hashers:
+            filename, _ = self.download({"/1.2.3/fakedriver_linux.zip": (None, None, ranged(self.payload))})
+        update_hashers.assert_not_called()
+        self.assertEqual(filename.read_bytes(), self.payload)
+
+
+class ChecksumTests(DownloadTest):
+    def test_digest_is_recorded_in_manifest(self):
+        filename, _ = self.download({"/1.2.3/fakedriver_linux.zip": (200, {}, self.payload)})
+        entry = self.manager.archive_manifest.get(self.manager._archive_key("1.2.3"))
+        self.assertEqual(entry["sha256"], hashlib.sha256(self.payload).hexdigest())
+        self.assertEqual(entry["size"], len(self.payload))
+
+    def test_published_checksum_mismatch_is_rejected(self):
+        with StubServer({"/1.2.3/fakedriver_linux.zip": (200, {}, self.payload)}) as server:
+            self.manager.base_url = server.url
+            self.manager._expected_checksums[f"{server.url}/1.2.3/fakedriver_linux.zip"] = {"md5": "0" * 32}
+            with self.assertRaises(RuntimeError):
+                self.manager.download("1.2.3", show_progress_bar=False)
+        self.assertFalse(self.part_file.exists())
+        self.assertFalse(self.part_file.with_suffix("").exists())
+
+    def test_corrupted_cached_archive_is_downloaded_again(self):
+        filename, _ = self.download({"/1.2.3/fakedriver_linux.zip": (200, {}, self.payload)})
+        filename.write_bytes(b"x" * len(self.payload))
+        filename, requests = self.download({"/1.2.3/fakedriver_linux.zip": (200, {}, self.payload)})
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(filename.read_bytes(), self.payload)
+
+
+class ExtractionTests(FakeDriverTest):
+    def test_only_driver_is_extracted(self):
+        manager = self.make_manager()
+        self.make_zip(
+            self.root / "fake" / "1.2.3" / "fakedriver_linux.zip",
+            {"Driver_Notes/credits.html": b"", "fakedriver_linux/fakedriver": b"#!/bin/sh\n", "LICENSE": b""},
+        )
+        binary, _ = manager.download_and_install("1.2.3", show_progress_bar=False)
+        self.assertEqual(binary, self.root / "fake" / "1.2.3" / "fakedriver_linux" / "fakedriver_linux" / "fakedriver")
+        extracted = [path.name for path in (self.root / "fake" / "1.2.3" / "fakedriver_linux").rglob("*") if path.is_file()]
+        self.assertEqual(extracted, ["fakedriver"])
+
+    def test_member_paths_stay_inside_extract_dir(self):
+        manager = self.make_manager()
+        self.make_zip(self.root / "fake" / "1.2.3" / "fakedriver_linux.zip", {"../../fakedriver": b"#!/bin/sh\n"})
+        binary, _ = manager.download_and_install("1.2.3", show_progress_bar=False)
+        self.assertEqual(binary, self.root / "fake" / "1.2.3" / "fakedriver_linux" / "fakedriver")
+
+    def test_valid_extracted_driver_is_reused(self):
+        binary, _ = self.make_manager().download_and_install("1.2.3", show_progress_bar=False)
+        manager = self.make_manager()
+        with mock.patch.object(manager, "_extract_driver") as extract_driver:
+            self.assertEqual(manager.download_and_install("1.2.3", show_progress_bar=False)[0], binary)
+        extract_driver.assert_not_called()
+
+    def test_modified_driver_is_extracted_again(self):
+        binary, _ = self.make_manager().download_and_install("1.2.3", show_progress_bar=False)
+        binary.write_bytes(b"truncated")
+        self.make_manager().download_and_install("1.2.3", show_progress_bar=False)
+        self.assertEqual(binary.read_bytes(), b"#!/bin/sh\n")
+
+    def test_partial_extract_dir_is_replaced(self):
+        manager = self.make_manager()
+        extract_dir = self.root / "fake" / "1.2.3" / "fakedriver_linux"
+        extract_dir.mkdir(parents=True)
+        (extract_dir / "fakedriver").write_bytes(b"#!/bin")
+        binary, _ = manager.download_and_install("1.2.3", show_progress_bar=False)
+        self.assertEqual(binary.read_bytes(), b"#!/bin/sh\n")
+        self.assertEqual(sorted(path.name for path in extract_dir.parent.iterdir()), ["fakedriver_linux", "fakedriver_linux.zip"])
+
+    def test_extract_dir_mode_follows_umask(self):
+        self.make_manager().download_and_install("1.2.3", show_progress_bar=False)
+        extract_dir = self.root / "fake" / "1.2.3" / "fakedriver_linux"
+        self.assertEqual(stat.S_IMODE(extract_dir.stat().st_mode), 0o777 & ~get_umask())
+
+    def test_existing_extract_dir_is_kept_while_driver_is_replaced(self):
+        manager = self.make_manager()
+        extract_dir = self.root / "fake" / "1.2.3" / "fakedriver_linux"
+        extract_dir.mkdir(parents=True)
+        (extract_dir / "fakedriver").write_bytes(b"#!/bin")
+        inode = extract_dir.stat().st_ino
+        with mock.patch("os.replace", wraps=os.replace) as replace:
+            binary, _ = manager.download_and_install("1.2.3", show_progress_bar=False)
+        self.assertEqual(extract_dir.stat().st_ino, inode)
+        self.assertNotIn(extract_dir, [call[0][1] for call in replace.call_args_list])
+        self.assertEqual(binary.read_bytes(), b"#!/bin/sh\n")
+
+    def test_leftovers_of_crashed_extractions_are_removed(self):
+        manager = self.make_manager()
+        leftovers = [
+            self.root / "fake" / "1.2.3" / ".fakedriver_linux.abc.tmp",
+            self.root / "fake" / "1.2.3" / ".fakedriver_linux.def.old",
+        ]
+        for leftover in leftovers:
+            leftover.mkdir(parents=True)
+            os.utime(leftover, (0, 0))
+        manager.download_and_install("1.2.3", show_progress_bar=False)
+        self.assertFalse(any(leftover.exists() for leftover in leftovers))
+
+    def test_failed_extraction_leaves_no_directories(self):
+        manager = self.make_manager()
+        with mock.patch.object(manager, "_extract_driver", side_effect=ValueError("boom")):
+            with self.assertRaises(RuntimeError):
+                manager.download_and_install("1.2.3", show_progress_bar=False)
+        self.assertEqual([path.name for path in (self.root / "fake" / "1.2.3").iterdir()], ["fakedriver_linux.zip"])
+
+
+class SingleFlightTests(DownloadTest):
+    def test_concurrent_installs_download_once(self):
+        managers = [
+            FakeDriverManager(download_root=self.root / "dl", link_path="SKIP", os_name="linux", bitness="64") for _ in range(4)
+        ]
+        with StubServer({"/1.2.3/fakedriver_linux.zip": (200, {}, self.payload)}) as server:
+            for manager in managers:
+                manager.base_url = server.url
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda manager: manager.download_and_install("1.2.3", False), managers))
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(len({binary for binary, _ in results}), 1)
+
+
+class SymlinkTests(FakeDriverTest):
+    def test_existing_link_is_replaced(self):
+        link_dir = self.make_link_dir()
+        (link_dir / "fakedriver").symlink_to(self.root / "missing")
+        binary, link = self.make_manager().download_and_install("1.2.3", show_progress_bar=False)
+        self.assertTrue(link.samefile(binary))
+        self.assertEqual([path.name for path in link_dir.iterdir()], ["fakedriver"])
+
+    def test_link_is_never_removed(self):
+        other_driver = self.root / "other" / "fakedriver"
+        other_driver.parent.mkdir()
+        other_driver.write_bytes(b"")
+        (self.make_link_dir() / "fakedriver").symlink_to(other_driver)
+        with mock.patch("os.unlink", side_effect=AssertionError("link removed")):
+            binary, link = self.make_manager().download_and_install("1.2.3", show_progress_bar=False)
+        self.assertTrue(link.samefile(binary))
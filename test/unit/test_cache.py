@@ -0,0 +1,91 @@
+import multiprocessing
+import stat
+import sys
+import time
+
+from .tools import SRC_ROOT, StubServer, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager.cache import HttpMetadataCache, JsonCache  # noqa: E402 I001
+from webdrivermanager.misc import get_umask  # noqa: E402 I001
+from webdrivermanager.transport import create_session  # noqa: E402 I001
+
+
+def store_keys(path, worker):
+    cache = JsonCache(path)
+    for number in range(50):
+        cache.set(f"{worker}:{number}", number)
+
+
+class JsonCacheTests(UnitBaseTest):
+    def test_roundtrip(self):
+        cache = JsonCache(self.root / "cache" / "versions.json")
+        cache.set("chrome:latest:linux:64", "114.0.5735.90")
+        self.assertEqual(JsonCache(cache.path).get("chrome:latest:linux:64"), "114.0.5735.90")
+
+    def test_expired_entry(self):
+        cache = JsonCache(self.root / "versions.json", ttl=10)
+        cache.set("key", "value")
+        data = cache._load()
+        data["key"]["timestamp"] = time.time() - 60
+        cache._save(data)
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get("key", ttl=120), "value")
+
+    def test_zero_ttl_disables_lookups(self):
+        cache = JsonCache(self.root / "versions.json", ttl=0)
+        cache.set("key", "value")
+        self.assertIsNone(cache.get("key"))
+
+    def test_corrupted_file_is_ignored(self):
+        path = self.root / "versions.json"
+        path.write_text("{not json")
+        self.assertIsNone(JsonCache(path).get("key"))
+
+    def test_file_mode_follows_umask(self):
+        path = self.root / "cache" / "versions.json"
+        JsonCache(path).set("key", "value")
+        self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o666 & ~get_umask())
+
+    def test_concurrent_processes_keep_all_entries(self):
+        path = self.root / "cache" / "archives.json"
+        processes = [multiprocessing.Process(target=store_keys, args=(path, worker)) for worker in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertEqual(len(JsonCache(path)._load()), 200)
+
+
+class HttpMetadataCacheTests(UnitBaseTest):
+    def test_not_modified_reuses_parsed_value(self):
+        def document(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return (304, {"ETag": '"v1"'}, b"")
+            return (200, {"ETag": '"v1"', "Last-Modified": "Mon, 02 Oct 2023 10:00:00 GMT"}, b"114.0.5735.90")
+
+        parsed = []
+
+        def parse(resp):
+            parsed.append(resp.text)
+            return resp.text
+
+        session = create_session(timeout=5)
+        with StubServer({"/LATEST_RELEASE": (None, None, document)}) as server:
+            for _ in range(2):
+                cache = HttpMetadataCache(self.root / "http")
+                resp, value = cache.get(session.get, f"{server.url}/LATEST_RELEASE", parse, params={"alt": "media"})
+                self.assertEqual(value, "114.0.5735.90")
+
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(len(parsed), 1)
+        self.assertNotIn("If-None-Match", server.requests[0][1])
+        self.assertEqual(server.requests[1][1]["If-Modified-Since"], "Mon, 02 Oct 2023 10:00:00 GMT")
+
+    def test_error_is_not_cached(self):
+        session = create_session(timeout=5)
+        with StubServer({"/missing": (404, {"ETag": '"v1"'}, b"")}) as server:
+            resp, value = HttpMetadataCache(self.root / "http").get(session.get, f"{server.url}/missing", lambda resp: resp.text)
+        self.assertEqual(resp.status_code, 404)
+        self.assertIsNone(value)
+        self.assertFalse((self.root / "http").exists())
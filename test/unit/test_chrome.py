@@ -0,0 +1,117 @@
+import json
+import sys
+from unittest import mock
+
+from .tools import SRC_ROOT, StubServer, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager import ChromeDriverManager  # noqa: E402 I001
+
+
+def json_response(data):
+    return (200, {"Content-Type": "application/json"}, json.dumps(data).encode())
+
+
+class ChromeListingTests(UnitBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.manager = ChromeDriverManager(download_root=self.root, link_path="SKIP", os_name="linux", bitness="64")
+
+    def test_download_url_uses_prefix_and_pagination(self):
+        pages = {
+            None: {"items": [{"name": "114.0.5735.90/chromedriver_mac64.zip", "mediaLink": "m"}], "nextPageToken": "p2"},
+            "p2": {
+                "items": [
+                    {
+                        "name": "114.0.5735.90/chromedriver_linux64.zip",
+                        "mediaLink": "http://example.invalid/linux64",
+                        "md5Hash": "AAECAwQFBgcICQoLDA0ODw==",
+                    },
+                ],
+            },
+        }
+
+        def listing(request):
+            self.assertEqual(request.query["prefix"], "114.0.5735.90/")
+            self.assertIn("items(name,mediaLink,size,md5Hash)", request.query["fields"])
+            return json_response(pages[request.query.get("pageToken")])
+
+        with StubServer({"/b/chromedriver/o": (None, None, listing)}) as server:
+            self.manager.chrome_driver_base_url = f"{server.url}/b/chromedriver"
+            url, filename = self.manager.get_download_url("114.0.5735.90")
+
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual((url, filename), ("http://example.invalid/linux64", "chromedriver_linux64.zip"))
+        self.assertEqual(self.manager._expected_checksums[url], {"md5": "000102030405060708090a0b0c0d0e0f"})
+
+    def test_legacy_compatible_version_is_one_request(self):
+        def release(request):
+            self.assertEqual(request.query["alt"], "media")
+            return (200, {}, b"114.0.5735.90\n")
+
+        with StubServer({"/b/chromedriver/o/LATEST_RELEASE_114.0.5735": (None, None, release)}) as server:
+            self.manager.chrome_driver_base_url = f"{server.url}/b/chromedriver"
+            with mock.patch.object(self.manager, "_get_browser_version", return_value="114.0.5735"):
+                self.assertEqual(self.manager.get_compatible_version(), "114.0.5735.90")
+        self.assertEqual(len(server.requests), 1)
+
+
+KNOWN_GOOD = {
+    "versions": [
+        {"version": "114.0.5735.90", "downloads": {"chrome": []}},
+        {
+            "version": "120.0.6099.71",
+            "downloads": {
+                "chromedriver": [
+                    {"platform": "linux64", "url": "http://example.invalid/120.0.6099.71/linux64/chromedriver-linux64.zip"}
+                ]
+            },
+        },
+        {
+            "version": "120.0.6099.109",
+            "downloads": {
+                "chromedriver": [
+                    {"platform": "linux64", "url": "http://example.invalid/120.0.6099.109/linux64/chromedriver-linux64.zip"}
+                ]
+            },
+        },
+        {
+            "version": "121.0.6167.85",
+            "downloads": {
+                "chromedriver": [
+                    {"platform": "win64", "url": "http://example.invalid/121.0.6167.85/win64/chromedriver-win64.zip"}
+                ]
+            },
+        },
+    ],
+}
+LAST_KNOWN_GOOD = {"channels": {"Stable": {"channel": "Stable", "version": "120.0.6099.109"}}}
+
+
+class ChromeForTestingTests(UnitBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.manager = ChromeDriverManager(download_root=self.root, link_path="SKIP", os_name="linux", bitness="64", cache_ttl=0)
+        self.server = self.start_server(
+            {
+                "/cft/known-good-versions-with-downloads.json": json_response(KNOWN_GOOD),
+                "/cft/last-known-good-versions.json": json_response(LAST_KNOWN_GOOD),
+            },
+        )
+        self.manager.chrome_for_testing_url = f"{self.server.url}/cft"
+
+    def test_latest_version_is_stable_channel(self):
+        self.assertEqual(self.manager.get_latest_version(), "120.0.6099.109")
+
+    def test_compatible_version_matches_browser_build(self):
+        with mock.patch.object(self.manager, "_get_browser_version", return_value="120.0.6099"):
+            self.assertEqual(self.manager.get_compatible_version(), "120.0.6099.109")
+
+    def test_index_is_fetched_once(self):
+        url, filename = self.manager.get_download_url("120.0.6099.71")
+        self.assertEqual(url, "http://example.invalid/120.0.6099.71/linux64/chromedriver-linux64.zip")
+        self.assertEqual(filename, "chromedriver-linux64.zip")
+        self.manager.get_download_url("120.0.6099.109")
+        with self.assertRaises(RuntimeError):
+            self.manager.get_download_url("121.0.6167.85")
+        self.assertEqual(len(self.server.requests), 1)
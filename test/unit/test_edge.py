@@ -0,0 +1,38 @@
+import sys
+
+from .tools import SRC_ROOT, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager import EdgeDriverManager  # noqa: E402 I001
+
+PAGE = b"""<html><body><div class="module">
+<p>Microsoft WebDriver for Edge</p>
+<a href="https://example.invalid/18.17763/index.html" aria-label="WebDriver for release number 18.17763">Release 18.17763</a>
+<a href="https://example.invalid/18.17763/x64/MicrosoftWebDriver.exe" aria-label="WebDriver for release number 18.17763 x64">x64</a>
+<a href="https://example.invalid/18.17763/x86/MicrosoftWebDriver.exe" aria-label="WebDriver for release number 18.17763 x86">x86</a>
+<a href="https://example.invalid/17.17134/MicrosoftWebDriver.exe" aria-label="WebDriver for release number 17.17134">Release 17.17134</a>
+</div></body></html>"""
+
+
+class EdgeReleaseTableTests(UnitBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.server = self.start_server({"/webdriver/": (200, {"Content-Type": "text/html"}, PAGE)})
+
+    def make_manager(self, bitness="64"):
+        manager = EdgeDriverManager(download_root=self.root, link_path="SKIP", os_name="win", bitness=bitness)
+        manager.edge_driver_base_url = f"{self.server.url}/webdriver/"
+        return manager
+
+    def test_page_is_parsed_once(self):
+        manager = self.make_manager()
+        self.assertEqual(manager.get_latest_version(), "18.17763")
+        self.assertEqual(manager.get_download_url("latest")[0], "https://example.invalid/18.17763/x64/MicrosoftWebDriver.exe")
+        self.assertEqual(
+            self.make_manager(bitness="32").get_download_url("18.17763"),
+            ("https://example.invalid/18.17763/x86/MicrosoftWebDriver.exe", "MicrosoftWebDriver.exe"),
+        )
+        self.assertEqual(manager.get_download_url("17.17134")[0], "https://example.invalid/17.17134/MicrosoftWebDriver.exe")
+        with self.assertRaises(RuntimeError):
+            manager.get_download_url("16.16299")
+        self.assertEqual(len(self.server.requests), 1)
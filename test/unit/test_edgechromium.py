@@ -0,0 +1,77 @@
+import sys
+
+from .tools import SRC_ROOT, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager import EdgeChromiumDriverManager  # noqa: E402 I001
+
+BLOB_URL = "https://msedgewebdriverstorage.blob.core.windows.net/edgewebdriver"
+VERSIONS = ["98.0.1108.43", "99.0.1150.30", "100.0.1185.29"]
+
+
+def listing(versions=(), prefixes=(), next_marker="", archs=("linux64", "mac64", "win32", "win64")):
+    blobs = "".join(
+        f"<Blob><Name>{version}/edgedriver_{arch}.zip</Name><Url>{BLOB_URL}/{version}/edgedriver_{arch}.zip</Url>"
+        f"<Properties><Content-Length>1</Content-Length></Properties></Blob>"
+        for version in versions
+        for arch in archs
+    )
+    blobs += "".join(f"<BlobPrefix><Name>{prefix}</Name></BlobPrefix>" for prefix in prefixes)
+    body = (
+        '\ufeff<?xml version="1.0" encoding="utf-8"?>'
+        f'<EnumerationResults ContainerName="{BLOB_URL}"><Blobs>{blobs}</Blobs><NextMarker>{next_marker}</NextMarker>'
+        "</EnumerationResults>"
+    )
+    return (200, {"Content-Type": "application/xml"}, body.encode("utf-8"))
+
+
+def container(request):
+    query = request.query
+    if query.get("delimiter") == "/":
+        if query.get("marker") == "2!page/2":
+            return listing(prefixes=[f"{version}/" for version in VERSIONS[1:]] + ["LATEST_STABLE/"])
+        return listing(prefixes=[f"{VERSIONS[0]}/"], next_marker="2!page/2")
+    if query.get("prefix", "").endswith("."):
+        major = query["prefix"]
+        return listing([version for version in VERSIONS if version.startswith(major)])
+    if "prefix" in query:
+        version = query["prefix"].rstrip("/")
+        # newest version has no linux build yet
+        return listing([version], archs=["win64"] if version == VERSIONS[-1] else ["linux64", "win64"])
+    return (400, {}, b"full listing")
+
+
+class EdgeChromiumListingTests(UnitBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.manager = EdgeChromiumDriverManager(download_root=self.root, link_path="SKIP", os_name="linux", bitness="64")
+        self.server = self.start_server({"/edgewebdriver": (None, None, container)})
+        self.manager.edgechromium_driver_base_url = f"{self.server.url}/edgewebdriver"
+
+    def test_full_listing_is_partitioned_by_major(self):
+        self.manager._populate_cache()
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(len(self.manager._index), len(VERSIONS))
+        self.assertEqual(self.manager.get_available_versions(), VERSIONS)
+
+    def test_pinned_version_lists_only_its_prefix(self):
+        url, filename = self.manager.get_download_url("98.0.1108.43")
+        self.assertEqual(url, f"{BLOB_URL}/98.0.1108.43/edgedriver_linux64.zip")
+        self.assertEqual(filename, "edgedriver_linux64.zip")
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertIn("prefix=98.0.1108.43%2F", self.server.requests[0][0])
+
+    def test_latest_version_uses_version_prefixes(self):
+        self.assertEqual(self.manager.get_latest_version(), "99.0.1150.30")
+        self.manager.get_download_url("99.0.1150.30")
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_index_answers_lookups_without_listing(self):
+        self.manager._populate_cache()
+        requests = len(self.server.requests)
+        self.assertEqual(self.manager.get_latest_version(), "100.0.1185.29")
+        url, _ = self.manager.get_download_url("99.0.1150.30")
+        self.assertEqual(url, f"{BLOB_URL}/99.0.1150.30/edgedriver_linux64.zip")
+        with self.assertRaises(RuntimeError):
+            self.manager.get_download_url("1.0.0.0")
+        self.assertEqual(len(self.server.requests), requests)
@@ -0,0 +1,104 @@
+import json
+import os
+import sys
+import time
+from unittest import mock
+
+from .tools import SRC_ROOT, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager import GeckoDriverManager  # noqa: E402 I001
+
+
+def release(tag, platforms, prerelease=False):
+    assets = []
+    for platform in platforms:
+        name = f"geckodriver-{tag}-{platform}"
+        assets.append({"name": name, "browser_download_url": f"http://example.invalid/{tag}/{name}"})
+        assets.append({"name": f"{name}.asc", "browser_download_url": f"http://example.invalid/{tag}/{name}.asc"})
+    return {"tag_name": tag, "draft": False, "prerelease": prerelease, "assets": assets}
+
+
+PAGES = {
+    "1": [
+        release("v0.34.0", ["linux64.tar.gz"], prerelease=True),
+        release("v0.33.0", ["linux64.tar.gz", "linux-aarch64.tar.gz", "macos.tar.gz", "macos-aarch64.tar.gz", "win64.zip"]),
+    ],
+    "2": [release("v0.32.0", ["linux32.tar.gz", "linux64.tar.gz", "macos.tar.gz", "win32.zip"])],
+}
+
+
+class GeckoReleaseIndexTests(UnitBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.server = self.start_server({"/repos/mozilla/geckodriver/releases": (None, None, self.releases)})
+
+    # Headers of a 403 response returned instead of the releases, None serves the releases
+    forbidden = None
+
+    def releases(self, request):
+        if self.forbidden is not None:
+            return (403, self.forbidden, b"forbidden")
+        self.assertEqual(request.query["per_page"], "100")
+        page = request.query.get("page", "1")
+        headers = {"Content-Type": "application/json"}
+        if page == "1":
+            headers["Link"] = f'<{self.server.url}/repos/mozilla/geckodriver/releases?per_page=100&page=2>; rel="next"'
+        return (200, headers, json.dumps(PAGES[page]).encode())
+
+    def make_manager(self, os_name="linux", bitness="64", **kwargs):
+        manager = GeckoDriverManager(download_root=self.root, link_path="SKIP", os_name=os_name, bitness=bitness, **kwargs)
+        manager.gecko_driver_releases_url = f"{self.server.url}/repos/mozilla/geckodriver/releases/"
+        return manager
+
+    def test_one_listing_answers_latest_and_pinned_lookups(self):
+        manager = self.make_manager()
+        self.assertEqual(manager.get_latest_version(), "v0.33.0")
+        url, filename = manager.get_download_url("v0.32.0")
+        self.assertEqual(url, "http://example.invalid/v0.32.0/geckodriver-v0.32.0-linux64.tar.gz")
+        self.assertEqual(filename, "geckodriver-v0.32.0-linux64.tar.gz")
+        with self.assertRaises(RuntimeError):
+            self.make_manager(os_name="win").get_download_url("v0.32.0")
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_platform_assets(self):
+        self.assertEqual(
+            self.make_manager(os_name="win", bitness="32").get_download_url("v0.32.0")[1], "geckodriver-v0.32.0-win32.zip"
+        )
+        self.assertEqual(self.make_manager(os_name="mac").get_download_url("v0.33.0")[1], "geckodriver-v0.33.0-macos.tar.gz")
+
+    def test_unknown_tag_refreshes_cached_index(self):
+        self.make_manager().get_latest_version()
+        PAGES["2"].append(release("v0.31.0", ["linux64.tar.gz"]))
+        try:
+            url, _ = self.make_manager().get_download_url("v0.31.0")
+        finally:
+            PAGES["2"].pop()
+        self.assertEqual(url, "http://example.invalid/v0.31.0/geckodriver-v0.31.0-linux64.tar.gz")
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_token_is_sent_to_api(self):
+        with mock.patch.dict(os.environ, {"GITHUB_TOKEN": "secret"}):
+            self.make_manager().get_latest_version()
+        self.assertEqual(self.server.requests[0][1]["Authorization"], "Bearer secret")
+
+    def test_rate_limit_skips_api_until_reset(self):
+        self.make_manager().get_latest_version()
+        self.forbidden = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 3600)}
+        # Expired index is used while rate limited
+        self.assertEqual(self.make_manager(cache_ttl=0).get_latest_version(), "v0.33.0")
+        url, _ = self.make_manager(cache_ttl=0).get_download_url("v0.32.0")
+        self.assertEqual(url, "http://example.invalid/v0.32.0/geckodriver-v0.32.0-linux64.tar.gz")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_secondary_rate_limit_waits_retry_after(self):
+        self.forbidden = {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": str(int(time.time()) + 3600), "Retry-After": "60"}
+        manager = self.make_manager()
+        self.assertIsNone(manager._github_api_get(f"{self.server.url}/repos/mozilla/geckodriver/releases"))
+        self.assertAlmostEqual(manager.rate_limits.get("api.github.com"), time.time() + 60, delta=5)
+
+    def test_forbidden_without_rate_limit_headers_is_not_rate_limit(self):
+        self.forbidden = {"X-RateLimit-Remaining": "4999"}
+        manager = self.make_manager()
+        self.assertEqual(manager._github_api_get(f"{self.server.url}/repos/mozilla/geckodriver/releases").status_code, 403)
+        self.assertIsNone(manager.rate_limits.get("api.github.com"))
@@ -0,0 +1,118 @@
+import json
+import sys
+
+from .tools import SRC_ROOT, StubServer, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager.cache import HttpMetadataCache  # noqa: E402 I001
+from webdrivermanager.listing import AzureBlobListing, GCSJsonListing, GCSXmlListing, ListedObject  # noqa: E402 I001
+from webdrivermanager.transport import create_session  # noqa: E402 I001
+
+
+def gcs_xml_page(keys, truncated):
+    contents = "".join(
+        f'<Contents><Key>{key}</Key><Size>3</Size><ETag>"0123456789abcdef0123456789abcdef"</ETag></Contents>' for key in keys
+    )
+    body = (
+        '<?xml version="1.0" encoding="UTF-8"?><ListBucketResult xmlns="http://doc.s3.amazonaws.com/2006-03-01">'
+        f"<Name>bucket</Name><IsTruncated>{str(truncated).lower()}</IsTruncated>{contents}</ListBucketResult>"
+    )
+    return (200, {}, body.encode())
+
+
+class ListingTests(UnitBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.session = create_session(timeout=5)
+
+    def test_gcs_xml_listing_continues_from_last_key(self):
+        def bucket(request):
+            if request.query.get("marker") == "2.0/IEDriverServer_x64_2.0.0.zip":
+                return gcs_xml_page(["3.0/IEDriverServer_x64_3.0.0.zip"], truncated=False)
+            return gcs_xml_page(["1.0/IEDriverServer_x64_1.0.0.zip", "2.0/IEDriverServer_x64_2.0.0.zip"], truncated=True)
+
+        with StubServer({"/": (None, None, bucket)}) as server:
+            listing = GCSXmlListing(self.session, server.url, match=lambda name: not name.startswith("2.0/"))
+            objects = listing.list().objects
+
+        self.assertEqual(
+            objects,
+            [
+                ListedObject(
+                    "1.0/IEDriverServer_x64_1.0.0.zip",
+                    f"{server.url}/1.0/IEDriverServer_x64_1.0.0.zip",
+                    3,
+                    "0123456789abcdef0123456789abcdef",
+                ),
+                ListedObject(
+                    "3.0/IEDriverServer_x64_3.0.0.zip",
+                    f"{server.url}/3.0/IEDriverServer_x64_3.0.0.zip",
+                    3,
+                    "0123456789abcdef0123456789abcdef",
+                ),
+            ],
+        )
+
+    def test_gcs_json_listing_with_prefixes(self):
+        page = {"items": [{"name": "a/b", "mediaLink": "http://example.invalid/a/b", "size": "7"}], "prefixes": ["a/c/"]}
+        with StubServer({"/b/bucket/o": (200, {}, json.dumps(page).encode())}) as server:
+            result = GCSJsonListing(self.session, f"{server.url}/b/bucket").list(prefix="a/", delimiter="/")
+        self.assertEqual(result.objects, [ListedObject("a/b", "http://example.invalid/a/b", 7, None)])
+        self.assertEqual(result.prefixes, ["a/c/"])
+        self.assertIn("delimiter=%2F", server.requests[0][0])
+
+    def test_azure_listing_uses_result_cache(self):
+        body = (
+            "<EnumerationResults><Blobs><Blob><Name>1.0/driver.zip</Name><Properties><Content-Length>5</Content-Length>"
+            "<Content-MD5>AAECAwQFBgcICQoLDA0ODw==</Content-MD5></Properties></Blob><BlobPrefix><Name>2.0/</Name></BlobPrefix>"
+            "</Blobs><NextMarker /></EnumerationResults>"
+        )
+        with StubServer({"/container": (200, {}, body.encode())}) as server:
+            listing = AzureBlobListing(self.session, f"{server.url}/container", cache={})
+            first = listing.list()
+            second = listing.list()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(
+            first.objects,
+            [ListedObject("1.0/driver.zip", f"{server.url}/container/1.0/driver.zip", 5, "000102030405060708090a0b0c0d0e0f")],
+        )
+        self.assertEqual(first.prefixes, ["2.0/"])
+
+    def test_not_modified_pages_are_read_from_metadata_cache(self):
+        page = {
+            "items": [
+                {"name": "a/b", "mediaLink": "http://example.invalid/a/b", "size": "7", "md5Hash": "AAECAwQFBgcICQoLDA0ODw=="}
+            ]
+        }
+
+        def bucket(request):
+            if request.headers.get("If-None-Match") == "etag":
+                return (304, {}, b"")
+            return (200, {"ETag": "etag"}, json.dumps(page).encode())
+
+        with StubServer({"/b/bucket/o": (None, None, bucket)}) as server:
+            results = [
+                GCSJsonListing(self.session, f"{server.url}/b/bucket", http_cache=HttpMetadataCache(self.root / "http")).list()
+                for _ in range(2)
+            ]
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(
+            results[1].objects, [ListedObject("a/b", "http://example.invalid/a/b", 7, "000102030405060708090a0b0c0d0e0f")]
+        )
+        self.assertEqual(len(server.requests), 2)
+
+    def test_revalidated_pages_keep_connection_alive(self):
+        def bucket(request):
+            if request.headers.get("If-None-Match") == "etag":
+                return (304, {"ETag": "etag"}, b"")
+            return (200, {"ETag": "etag"}, json.dumps({"items": []}).encode())
+
+        with StubServer({"/b/bucket/o": (None, None, bucket)}) as server:
+            for _ in range(5):
+                GCSJsonListing(self.session, f"{server.url}/b/bucket", http_cache=HttpMetadataCache(self.root / "http")).list()
+
+        self.assertEqual(len(server.requests), 5)
+        self.assertEqual(len(server.clients), 1)
@@ -0,0 +1,20 @@
+import sys
+
+from .tools import SRC_ROOT, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager.lock import FileLock  # noqa: E402 I001
+
+
+class FileLockTests(UnitBaseTest):
+    def test_lock_is_exclusive(self):
+        with FileLock(self.root / "locks" / "driver.lock"):
+            with self.assertRaises(RuntimeError):
+                FileLock(self.root / "locks" / "driver.lock", timeout=0.2, poll_interval=0.05).acquire()
+
+    def test_lock_can_be_taken_after_release(self):
+        lock = FileLock(self.root / "driver.lock")
+        with lock:
+            pass
+        with FileLock(self.root / "driver.lock", timeout=0):
+            self.assertTrue(lock.path.exists())
@@ -0,0 +1,53 @@
+import argparse
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from unittest import mock
+
+from .tools import SRC_ROOT, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager import __main__ as cli  # noqa: E402 I001
+
+
+def fake_install_driver(args, browser, output=print, show_progress_bar=True):
+    if browser == "broken":
+        output('Downloading WebDriver for browser: "broken"')
+        raise RuntimeError("no such release")
+    for line in range(3):
+        output(f"{browser} line {line}")
+        time.sleep(0.01)
+
+
+class ParallelInstallTests(UnitBaseTest):
+    def run_jobs(self, browsers):
+        args = argparse.Namespace(browser=browsers, jobs=len(browsers))
+        stdout = io.StringIO()
+        with mock.patch.object(cli, "install_driver", side_effect=fake_install_driver), redirect_stdout(stdout):
+            try:
+                cli.install_drivers_in_parallel(args)
+            except SystemExit as exc:
+                return stdout.getvalue(), exc.code
+        return stdout.getvalue(), 0
+
+    def test_failed_job_exits_with_error(self):
+        output, code = self.run_jobs(["chrome", "broken", "gecko"])
+        self.assertEqual(code, 1)
+        self.assertIn('Failed to install WebDriver for "broken": no such release', output)
+
+    def test_output_of_each_driver_is_one_block(self):
+        output, code = self.run_jobs(["chrome", "gecko", "ie"])
+        self.assertEqual(code, 0)
+        blocks = [block.splitlines() for block in output.strip().split("\n\n")]
+        self.assertEqual(sorted(block[0].split()[0] for block in blocks), ["chrome", "gecko", "ie"])
+        for block in blocks:
+            browser = block[0].split()[0]
+            self.assertEqual(block, [f"{browser} line {line}" for line in range(3)])
+
+    def test_unrecognized_browser_is_not_a_failure(self):
+        args = argparse.Namespace(browser=["netscape"], jobs=2)
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            cli.install_drivers_in_parallel(args)
+        self.assertIn('Unrecognized browser: "netscape".  Ignoring...', stdout.getvalue())
@@ -0,0 +1,25 @@
+import sys
+
+from .tools import SRC_ROOT, StubServer, UnitBaseTest
+
+sys.path.append(SRC_ROOT)
+from webdrivermanager.transport import TimeoutSession, create_session, get_session  # noqa: E402 I001
+
+
+class TransportTests(UnitBaseTest):
+    def test_shared_session_is_reused(self):
+        self.assertIs(get_session(), get_session())
+        self.assertIsInstance(get_session(), TimeoutSession)
+
+    def test_host_specific_pool(self):
+        session = create_session(host_pool_sizes={"https://example.com": 3})
+        self.assertEqual(session.get_adapter("https://example.com/foo")._pool_maxsize, 3)
+        self.assertIsNot(session.get_adapter("https://example.org/"), session.get_adapter("https://example.com/"))
+
+    def test_connection_is_kept_alive(self):
+        routes = {"/a": (200, {}, b"a"), "/b": (200, {}, b"b")}
+        with StubServer(routes) as server:
+            session = create_session(timeout=5)
+            self.assertEqual(session.get(f"{server.url}/a").text, "a")
+            self.assertEqual(session.get(f"{server.url}/b").text, "b")
+            self.assertEqual(len(server.clients), 1)
@@ -0,0 +1,97 @@
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+SRC_ROOT = str(Path(__file__).absolute().parent.parent.parent / "src")
+
+
+class UnitBaseTest(TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def start_server(self, routes):
+        """Starts a StubServer that is shut down when the test ends."""
+        server = StubServer(routes).__enter__()
+        self.addCleanup(server.__exit__)
+        return server
+
+    def make_link_dir(self):
+        link_path = self.root / "bin"
+        link_path.mkdir(parents=True, exist_ok=True)
+        return link_path
+
+    @staticmethod
+    def make_zip(path, members):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(path, mode="w") as archive:
+            for name, data in members.items():
+                archive.writestr(name, data)
+        return path
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.server.requests.append((self.path, dict(self.headers)))
+        self.server.clients.add(self.client_address)
+        route = self.server.routes.get(self.path) or self.server.routes.get(urlsplit(self.path).path)
+        status, headers, body = route or (404, {}, b"not found")
+        if callable(body):
+            status, headers, body = body(self)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @property
+    def query(self):
+        return {name: values[0] for name, values in parse_qs(urlsplit(self.path).query).items()}
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    """Local HTTP server answering GET requests from a dict of path -> (status, headers, body)."""
+
+    def __init__(self, routes=None):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.httpd.routes = routes or {}
+        self.httpd.requests = []
+        self.httpd.clients = set()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    @property
+    def routes(self):
+        return self.httpd.routes
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    @property
+    def clients(self):
+        return self.httpd.clients
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()